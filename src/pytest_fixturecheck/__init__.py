@@ -69,6 +69,7 @@ except ImportError:
 
 from .utils import creates_validator
 from .validators import (
+    FixtureCheckWarning,
     combines_validators,
     has_property_values,
     has_required_fields,
@@ -115,6 +116,7 @@ __all__ = [
     "check_property_values",
     "with_property_values",
     "combines_validators",
+    "FixtureCheckWarning",
     # Django validators
     "DJANGO_AVAILABLE",
     "is_django_model",
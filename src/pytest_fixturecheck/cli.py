@@ -1,12 +1,10 @@
 """Command-line interface for fixturecheck."""
 
-from pathlib import Path
 from typing import Any, Dict
 
 import click
 
 from .plugin import FixtureCheckPlugin
-from .utils import find_test_files
 
 
 @click.group()
@@ -36,28 +34,18 @@ def fixturecheck():
 )
 def report(path: str, pattern: str, verbose: int):
     """Generate a report of fixture check opportunities and current usage."""
-    test_path = Path(path)
-    test_files = find_test_files(test_path, pattern)
-
-    plugin = FixtureCheckPlugin()
-    opportunities = 0
-    existing_checks = 0
+    analysis = FixtureCheckPlugin().analyze(path, pattern, details=verbose > 0)
 
     if verbose > 0:
         click.echo("FIXTURE CHECK REPORT")
         click.echo("=" * 50)
 
-    for test_file in test_files:
-        with open(test_file) as f:
-            content = f.read()
-
-        if verbose > 0:
-            # Get detailed fixture information
-            opportunities_details = plugin.get_opportunities_details(content, str(test_file))
-            existing_details = plugin.get_existing_checks_details(content, str(test_file))
+        for entry in analysis["files"]:
+            opportunities_details = entry["opportunity_details"]
+            existing_details = entry["existing_details"]
 
             if opportunities_details or existing_details:
-                click.echo(f"\nFile: {test_file}")
+                click.echo(f"\nFile: {entry['path']}")
                 click.echo("-" * 40)
 
                 if opportunities_details:
@@ -70,16 +58,10 @@ def report(path: str, pattern: str, verbose: int):
                     for detail in existing_details:
                         _print_fixture_detail(detail, verbose)
 
-        # Count opportunities (fixtures without checks)
-        opportunities += plugin.count_opportunities(content)
-        # Count existing checks
-        existing_checks += plugin.count_existing_checks(content)
-
-    if verbose > 0:
         click.echo("\n" + "=" * 50)
 
-    click.echo(f"Found {opportunities} opportunities for fixture checks")
-    click.echo(f"Found {existing_checks} existing fixture checks")
+    click.echo(f"Found {analysis['opportunities']} opportunities for fixture checks")
+    click.echo(f"Found {analysis['existing']} existing fixture checks")
 
 
 def _print_fixture_detail(detail: Dict[str, Any], verbose: int):
@@ -116,15 +98,15 @@ def _print_fixture_detail(detail: Dict[str, Any], verbose: int):
 )
 def add(path: str, pattern: str, dry_run: bool):
     """Add fixture checks to test files."""
-    test_path = Path(path)
-    test_files = find_test_files(test_path, pattern)
-
     plugin = FixtureCheckPlugin()
 
-    for test_file in test_files:
-        with open(test_file) as f:
-            content = f.read()
+    for entry in plugin.analyze(path, pattern)["files"]:
+        # Only files with unchecked fixtures can change
+        if not entry["opportunities"]:
+            continue
 
+        test_file = entry["path"]
+        content = entry["content"]
         modified_content = plugin.add_fixture_checks(content)
 
         if modified_content != content:
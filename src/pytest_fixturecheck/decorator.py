@@ -7,7 +7,8 @@ F = TypeVar("F", bound=Callable[..., Any])
 ValidatorFunc = Callable[[Any, bool], None]
 
 # Import validators and utils
-from . import validators
+from . import plugin, validators
+from .utils import _mark_validator
 from .validators_fix import check_property_values
 
 # Try to import from .django_validators. These names should always be available from there.
@@ -46,6 +47,8 @@ def fixturecheck(
         wrapped_fixture._fixturecheck = True  # type: ignore
         wrapped_fixture._validator = chosen_validator_func  # type: ignore
         wrapped_fixture._expect_validation_error = expect_validation_error  # type: ignore
+        # Let the plugin's pytest_fixture_setup hook start looking for marked fixtures
+        plugin._fixturecheck_registered = True
         return cast(F, wrapped_fixture)
 
     # Case 1: Direct decorator usage e.g. @fixturecheck (on actual fixture func)
@@ -233,7 +236,7 @@ def with_model_validation(*field_names: str) -> Callable[[F], F]:
         django_model_validates()(obj, is_collection_phase)
 
     # Mark as a validator
-    validator._is_pytest_fixturecheck_validator = True  # type: ignore
+    _mark_validator(validator)
 
     # Return the decorator
     return lambda fixture: fixturecheck(validator)(fixture)
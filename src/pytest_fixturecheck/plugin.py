@@ -1,20 +1,54 @@
 import ast
 import inspect
+import io
+import os
+import re
+import sys
 import traceback
-from typing import Any, Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import pytest
 
-from .utils import is_async_function, is_coroutine
+from .utils import find_test_files, is_async_function, is_coroutine
 
-# Check if pytest-asyncio is installed
-PYTEST_ASYNCIO_INSTALLED = False
-try:
-    import pytest_asyncio
+# Matches error messages from fixtures that can't be executed outside an event loop
+# ("asyncio", "coroutine", "awaitable", "async ...", "no current event loop").
+# Other event loop errors ("Event loop is closed", "This event loop is already
+# running") are real fixture bugs and must still be reported.
+_ASYNC_ERROR_RE = re.compile(
+    r"async|coroutine|awaitable|no (?:current|running) event loop", re.IGNORECASE
+)
 
-    PYTEST_ASYNCIO_INSTALLED = True
-except ImportError:
-    pass
+
+def _is_async_error(error: Exception) -> bool:
+    """Return True if *error* looks like it came from running async code synchronously."""
+    return _ASYNC_ERROR_RE.search(str(error)) is not None
+
+
+# Set by the @fixturecheck decorator the first time it wraps a fixture. Until
+# then no fixture can carry the marker, so pytest_fixture_setup has nothing to do.
+_fixturecheck_registered = False
+
+# Whether pytest-asyncio is installed. None until first needed, so the plugin
+# does not look for pytest-asyncio on every pytest run.
+PYTEST_ASYNCIO_INSTALLED: Optional[bool] = None
+
+
+def _pytest_asyncio_installed() -> bool:
+    """Return True if pytest-asyncio is installed, checking only once.
+
+    Uses find_spec so the (unused) package is located without being imported.
+    """
+    global PYTEST_ASYNCIO_INSTALLED
+    if PYTEST_ASYNCIO_INSTALLED is None:
+        PYTEST_ASYNCIO_INSTALLED = find_spec("pytest_asyncio") is not None
+    return PYTEST_ASYNCIO_INSTALLED
 
 
 def pytest_addoption(parser):
@@ -25,23 +59,71 @@ def pytest_addoption(parser):
         default="false",
         type="bool",
     )
+    parser.addini(
+        "fixturecheck-parallel",
+        help="Run @fixturecheck validators on fixture results concurrently in a thread pool",
+        default="false",
+        type="bool",
+    )
+
+
+def _ini_flag(config: Any, name: str) -> bool:
+    """Read a bool ini option, accepting both parsed bools and raw strings."""
+    value = config.getini(name)
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return value is True
+
+
+def _config_flag(config: Any, attr: str, name: str) -> bool:
+    """Return the ini flag cached on *config* as *attr* by pytest_configure.
+
+    Falls back to reading the ini option for configs that bypassed pytest_configure.
+    """
+    value = getattr(config, attr, None)
+    if isinstance(value, bool):
+        return value
+    return _ini_flag(config, name)
 
 
 def pytest_configure(config: Any) -> None:
     """Register the plugin with pytest."""
     config.addinivalue_line("markers", "fixturecheck: mark a test as using fixture validation")
+    # Fixtures marked with @fixturecheck, registered by pytest_fixture_setup.
+    # FixtureDef keeps object's identity hash, so a set is as cheap as keying
+    # a dict by id() and avoids the extra id() call per registration.
+    config._fixturecheck_fixtures = set()
     # Note: We don't need to call addinivalue_line for fixturecheck-auto-skip
-    # since it's already registered as a bool type option in pytest_addoption
+    # since it's already registered as a bool type option in pytest_addoption.
+    # Both options are parsed once here and read back in pytest_collection_finish.
+    config._fixturecheck_auto_skip = _ini_flag(config, "fixturecheck-auto-skip")
+    config._fixturecheck_parallel = _ini_flag(config, "fixturecheck-parallel")
 
 
 def is_async_fixture(fixturedef: Any) -> bool:
-    """Check if a fixture is an async fixture."""
+    """Check if a fixture is an async fixture.
+
+    The result is cached on the fixturedef, since both pytest_fixture_setup and
+    pytest_collection_finish ask about the same fixtures.
+    """
+    cached = getattr(fixturedef, "_fixturecheck_is_async", None)
+    if isinstance(cached, bool):
+        return cached
+
+    result = _detect_async_fixture(fixturedef)
+    fixturedef._fixturecheck_is_async = result
+    return result
+
+
+def _detect_async_fixture(fixturedef: Any) -> bool:
+    """Uncached implementation of is_async_fixture."""
     # Check if the fixture function is a coroutine function
     if is_async_function(fixturedef.func):
         return True
 
     # Check for pytest-asyncio specific attributes
-    if hasattr(fixturedef, "unittest") and "async" in str(fixturedef.unittest).lower():
+    unittest = getattr(fixturedef, "unittest", None)
+    if unittest is not None and "async" in str(unittest).lower():
         return True
 
     # Check fixture name patterns that typically indicate async fixtures
@@ -49,7 +131,7 @@ def is_async_fixture(fixturedef: Any) -> bool:
         return True
 
     # Direct check of pytest-asyncio fixture detection if available
-    if PYTEST_ASYNCIO_INSTALLED:
+    if _pytest_asyncio_installed():
         try:
             return hasattr(fixturedef, "_pytest_asyncio_scope")
         except (AttributeError, ImportError):
@@ -58,30 +140,77 @@ def is_async_fixture(fixturedef: Any) -> bool:
     return False
 
 
+def _has_fixturecheck_marker(func: Any) -> bool:
+    """Return True if *func* was produced by the @fixturecheck decorator."""
+    return bool(getattr(func, "_fixturecheck", False))
+
+
+def _find_marked_func(func: Any) -> Any:
+    """Return the function in *func*'s ``__wrapped__`` chain marked with _fixturecheck.
+
+    Falls back to *func* itself when nothing in the chain is marked.
+    """
+    # Cheap checks first: usually @fixturecheck is the outermost decorator, and
+    # undecorated fixtures have no wrapper chain to walk at all.
+    if _has_fixturecheck_marker(func) or not hasattr(func, "__wrapped__"):
+        return func
+
+    try:
+        marked_func = inspect.unwrap(func, stop=_has_fixturecheck_marker)
+    except ValueError:
+        # Cyclic or absurdly deep __wrapped__ chain: treat it as unmarked
+        return func
+    return marked_func if _has_fixturecheck_marker(marked_func) else func
+
+
+def _resolve_fixturecheck(fixturedef: Any) -> Tuple[Any, Any, Any]:
+    """Return ``(marked_func, validator, expect_validation_error)`` for *fixturedef*.
+
+    The result is cached on the fixturedef, so the wrapper chain is walked once
+    rather than on every fixture setup and again during collection.
+    """
+    func = fixturedef.func
+    cached = getattr(fixturedef, "_fixturecheck_resolved", None)
+    # Keyed on the function so a fixturedef whose func is replaced is re-resolved
+    if isinstance(cached, tuple) and cached[0] is func:
+        return cached[1:]
+
+    # The _validator and _expect_validation_error attributes live on
+    # whichever function in the wrapper chain carries _fixturecheck.
+    marked_func = _find_marked_func(func)
+    resolved = (
+        marked_func,
+        getattr(marked_func, "_validator", None),
+        getattr(marked_func, "_expect_validation_error", False),
+    )
+    fixturedef._fixturecheck_resolved = (func,) + resolved
+    return resolved
+
+
+# tryfirst: register the fixture before pytest's own (firstresult) implementation
+# executes it; returning None lets that implementation still run.
+@pytest.hookimpl(tryfirst=True)
 def pytest_fixture_setup(fixturedef: Any, request: Any) -> None:
     """Hook executed when a fixture is about to be setup.
 
     We use this to track which fixtures have been marked with @fixturecheck.
     """
-    fixture_func = fixturedef.func
-
-    # Support different decorator orders - check original fixture if wrapped
-    if hasattr(fixture_func, "__wrapped__"):
-        # Check if any wrapper in the chain has _fixturecheck
-        current_func = fixture_func
-        while hasattr(current_func, "__wrapped__"):
-            if getattr(current_func, "_fixturecheck", False):
-                fixture_func = current_func  # Use the wrapped function with fixturecheck
-                break
-            current_func = current_func.__wrapped__
+    if not _fixturecheck_registered:
+        return
+
+    # Support different decorator orders - find the wrapper carrying _fixturecheck
+    fixture_func = _resolve_fixturecheck(fixturedef)[0]
 
     # Check if this fixture has been marked with @fixturecheck
-    if getattr(fixture_func, "_fixturecheck", False):
-        # Register it to be validated during collection
-        if not hasattr(request.config, "_fixturecheck_fixtures"):
-            request.config._fixturecheck_fixtures = set()
+    if _has_fixturecheck_marker(fixture_func):
+        # Register it to be validated during collection. The registry is created
+        # in pytest_configure; only configs that bypassed it need one here.
+        try:
+            fixturecheck_fixtures = request.config._fixturecheck_fixtures
+        except AttributeError:
+            fixturecheck_fixtures = request.config._fixturecheck_fixtures = set()
 
-        request.config._fixturecheck_fixtures.add(fixturedef)
+        fixturecheck_fixtures.add(fixturedef)
 
         # Pre-mark async fixtures to skip execution validation
         if is_async_fixture(fixturedef):
@@ -93,162 +222,34 @@ def pytest_collection_finish(session: Any) -> None:
 
     This runs before any tests execute, so we can catch fixture errors early.
     """
-    if not hasattr(session.config, "_fixturecheck_fixtures"):
-        return
-
-    fixtures_to_validate = session.config._fixturecheck_fixtures
+    fixtures_to_validate = getattr(session.config, "_fixturecheck_fixtures", None)
     if not fixtures_to_validate:
         return
 
     failed_fixtures = []
-    auto_skip = session.config.getini("fixturecheck-auto-skip") == "true"
-
-    for fixturedef in fixtures_to_validate:
-        try:
-            # Get the fixture function and validator
-            fixture_original_func = fixturedef.func  # The func pytest associates with fixturedef
-
-            # Default to attributes from this original_func.
-            # These will be used if the original_func is not wrapped, or if it is wrapped
-            # but the _fixturecheck marker (and thus validator) is on original_func itself,
-            # or if the marker is on an inner function that the loop below finds.
-            validator = getattr(fixture_original_func, "_validator", None)
-            expect_validation_error = getattr(
-                fixture_original_func, "_expect_validation_error", False
-            )
-
-            # If fixture_original_func is wrapped, we need to search for the actual function
-            # in the wrapper chain that has _fixturecheck=True, as that's where
-            # _validator and _expect_validation_error will be.
-            if hasattr(fixture_original_func, "__wrapped__"):
-                current_search_func = fixture_original_func
-                while True:  # Loop from outermost to innermost
-                    # Check if the current function in the chain has the marker
-                    if getattr(current_search_func, "_fixturecheck", False):
-                        # Marker found on this current_search_func. Use its attributes.
-                        validator = getattr(current_search_func, "_validator", None)
-                        expect_validation_error = getattr(
-                            current_search_func, "_expect_validation_error", False
-                        )
-                        break  # Found the true source of attributes, stop searching
-
-                    # If no more wrappers, and we haven't found the marker by break-ing,
-                    # the attributes from fixture_original_func (if it had the marker)
-                    # or the defaults (None/False) will be used.
-                    # The 'validator' and 'expect_validation_error' are already pre-set
-                    # using fixture_original_func. If the marker was on fixture_original_func itself,
-                    # those are correct. If the marker was on an inner function, this loop
-                    # would have updated them and broken. If the marker was *not* on an inner
-                    # function reached so far, and this is the innermost, then the pre-set
-                    # values (from original_func) remain correct if original_func was marked.
-                    if not hasattr(current_search_func, "__wrapped__"):
-                        break  # Reached the innermost function
-
-                    current_search_func = current_search_func.__wrapped__
-
-            # At this point, 'validator' and 'expect_validation_error' should be correctly set
-            # from the function in the (potential) wrapper chain that has _fixturecheck = True.
-
-            # First, run validator on the fixture function itself if there's a validator
-            if validator is not None:
-                try:
-                    # Pass the function object and True to indicate collection phase
-                    validator(fixture_original_func, True)
-
-                    # If we expected validation error but didn't get one
-                    if expect_validation_error:
-                        failed_fixtures.append(
-                            (
-                                fixturedef,
-                                AssertionError(
-                                    "Expected validation error but none occurred during collection phase"
-                                ),
-                                "No validation error during collection phase",
-                            )
-                        )
-                except Exception as e:
-                    # If we were expecting an error, this is good - don't record it as a failure
-                    if expect_validation_error:
-                        continue
-                    else:
-                        # Unexpected error - record it
-                        failed_fixtures.append((fixturedef, e, traceback.format_exc()))
-                        continue
-
-            # Skip validation for unittest fixtures, async fixtures, and other special types
-            if (
-                hasattr(fixturedef, "unittest")
-                or getattr(fixturedef, "_fixturecheck_skip", False)
-                or is_async_fixture(fixturedef)
-            ):
-                continue
-
-            # Create a request context for this fixture
-            try:
-                request = session._fixturemanager.getfixturerequest(session)
-
-                # Execute the fixture
-                try:
-                    result = fixturedef.execute(request)
-
-                    # Handle coroutine objects (returned by async fixtures)
-                    if is_coroutine(result):
-                        # Mark it to skip validation - can't execute coroutines during collection
-                        fixturedef._fixturecheck_skip = True
-                        continue
-
-                    # If there's a validator function, run it on the fixture result
-                    if validator is not None and result is not None:
-                        try:
-                            # Pass the result and False to indicate execution phase
-                            validator(result, False)
-
-                            # If we expected a validation error but didn't get one
-                            if expect_validation_error:
-                                failed_fixtures.append(
-                                    (
-                                        fixturedef,
-                                        AssertionError(
-                                            "Expected validation error but none occurred during execution phase"
-                                        ),
-                                        "No validation error during execution phase",
-                                    )
-                                )
-                        except Exception as e:
-                            # If we were expecting an error, this is good
-                            if expect_validation_error:
-                                continue
-                            else:
-                                # Unexpected error - record it
-                                failed_fixtures.append((fixturedef, e, traceback.format_exc()))
-                                continue
-                except Exception as e:
-                    # Special handling for pytest-asyncio fixtures and other async-related errors
-                    if any(
-                        x in str(e).lower() for x in ["asyncio", "coroutine", "awaitable", "async"]
-                    ):
-                        # Skip asyncio fixtures - they can't be executed during collection
-                        fixturedef._fixturecheck_skip = True
-                        continue
-                    else:
-                        # If we expected a validation error, this might be it
-                        if expect_validation_error:
-                            continue
-                        raise
-            except Exception as e:
-                # If we were expecting an error during fixture execution, this is fine
-                if expect_validation_error:
-                    continue
-                # Capture and store the error
-                failed_fixtures.append((fixturedef, e, traceback.format_exc()))
-
-        except Exception as e:
-            # If we were expecting an error, this is fine
-            if expect_validation_error:
-                continue
+    auto_skip = _config_flag(session.config, "_fixturecheck_auto_skip", "fixturecheck-auto-skip")
+    parallel = _config_flag(session.config, "_fixturecheck_parallel", "fixturecheck-parallel")
+
+    if parallel and len(fixtures_to_validate) > 1:
+        # pytest's fixture state (cached results, finalizers, shared dependency
+        # fixturedefs) is not thread-safe, so fixtures are executed one at a
+        # time here; only the validators run on their results, which may wait on
+        # I/O (databases, HTTP mocks), overlap
+        executed = [_execute_fixture(session, fixturedef) for fixturedef in fixtures_to_validate]
+        checks = [check_result for _, check_result in executed if check_result is not None]
+        check_failures: Iterator[List[Tuple]] = iter(())
+        if checks:
+            with ThreadPoolExecutor(max_workers=min(32, len(checks))) as executor:
+                check_failures = iter(list(executor.map(lambda check: check(), checks)))
+        results = [
+            failures + next(check_failures) if check_result is not None else failures
+            for failures, check_result in executed
+        ]
+    else:
+        results = [_validate_fixture(session, fixturedef) for fixturedef in fixtures_to_validate]
 
-            # Capture and store the error
-            failed_fixtures.append((fixturedef, e, traceback.format_exc()))
+    for failures in results:
+        failed_fixtures.extend(failures)
 
     # If any fixtures failed, report the errors
     if failed_fixtures:
@@ -257,13 +258,206 @@ def pytest_collection_finish(session: Any) -> None:
             pytest.exit("Fixture validation failed", 1)
         else:
             # Mark the failing tests for skipping
+            # Only the failing fixtures' names are needed, not every fixture in the session
+            fixture_to_items = _index_items_by_fixture(
+                session.items, {fixturedef.argname for fixturedef, _, _ in failed_fixtures}
+            )
             for fixturedef, error, _ in failed_fixtures:
-                _mark_dependent_tests_for_skip(session, fixturedef, error)
+                _mark_dependent_tests_for_skip(session, fixturedef, error, fixture_to_items)
+
+
+def _validate_fixture(session: Any, fixturedef: Any) -> List[Tuple]:
+    """Validate one fixture marked with @fixturecheck.
 
+    Returns a list of ``(fixturedef, error, traceback)`` tuples for the
+    failures found, which is empty if the fixture is valid.
+    """
+    failures, check_result = _execute_fixture(session, fixturedef)
+    if check_result is not None:
+        failures.extend(check_result())
+    return failures
+
+
+def _execute_fixture(
+    session: Any, fixturedef: Any
+) -> Tuple[List[Tuple], Optional[Callable[[], List[Tuple]]]]:
+    """Run the collection-phase check of one fixture and execute it.
+
+    Returns the failures found so far and, if the fixture produced a result to
+    validate, a callable that runs the execution-phase check on that result and
+    returns its failures. Executing a fixture touches pytest's shared fixture
+    state, so this must run on the main thread; only the returned check is
+    safe to run concurrently.
+    """
+    failures: List[Tuple] = []
+    # Set before the try so the outer handler can always read it
+    expect_validation_error = False
+    try:
+        # Get the fixture function and validator
+        fixture_original_func = fixturedef.func  # The func pytest associates with fixturedef
+
+        # Usually already resolved when pytest_fixture_setup registered it
+        marked_func, validator, expect_validation_error = _resolve_fixturecheck(fixturedef)
+
+        # First, run validator on the fixture function itself if there's a validator
+        if validator is not None:
+            try:
+                # Pass the function object and True to indicate collection phase
+                validator(fixture_original_func, True)
+
+                # If we expected validation error but didn't get one
+                if expect_validation_error:
+                    failures.append(
+                        (
+                            fixturedef,
+                            AssertionError(
+                                "Expected validation error but none occurred during collection phase"
+                            ),
+                            "No validation error during collection phase",
+                        )
+                    )
+            except Exception as e:
+                # If we were expecting an error, this is good - don't record it as a failure
+                _record_unexpected_error(failures, fixturedef, e, expect_validation_error)
+                return failures, None
+
+        # Without a validator, executing the fixture can only surface an
+        # unexpected error; if an error is expected there is nothing to report.
+        if validator is None and expect_validation_error:
+            return failures, None
+
+        # Skip validation for unittest fixtures, async fixtures, and other special types
+        if (
+            hasattr(fixturedef, "unittest")
+            or getattr(fixturedef, "_fixturecheck_skip", False)
+            or is_async_fixture(fixturedef)
+        ):
+            return failures, None
+
+        # Create a request context for this fixture
+        try:
+            request = session._fixturemanager.getfixturerequest(session)
+        except Exception as e:
+            _record_unexpected_error(failures, fixturedef, e, expect_validation_error)
+            return failures, None
+
+        # Execute the fixture. Failures are handled here rather than re-raised
+        # to an outer handler, so each error is only unwound once.
+        try:
+            result = fixturedef.execute(request)
+        except Exception as e:
+            if _is_async_error(e):
+                # Skip asyncio fixtures - they can't be executed during collection
+                fixturedef._fixturecheck_skip = True
+            else:
+                # If we expected a validation error, this might be it
+                _record_unexpected_error(failures, fixturedef, e, expect_validation_error)
+            return failures, None
 
-def _mark_dependent_tests_for_skip(session: Any, fixturedef: Any, error: Exception) -> None:
-    """Mark tests that depend on the failing fixture for skipping."""
+        # Handle coroutine objects (returned by async fixtures)
+        if is_coroutine(result):
+            # Mark it to skip validation - can't execute coroutines during collection
+            fixturedef._fixturecheck_skip = True
+            return failures, None
+
+        # If there's a validator function, run it on the fixture result
+        if validator is not None and result is not None:
+            # Bound to locals so the check doesn't depend on this frame's later state
+            return failures, partial(
+                _check_result, fixturedef, marked_func, validator, result, expect_validation_error
+            )
+
+    except Exception as e:
+        # If we were expecting an error, this is fine
+        _record_unexpected_error(failures, fixturedef, e, expect_validation_error)
+
+    return failures, None
+
+
+def _check_result(
+    fixturedef: Any,
+    marked_func: Any,
+    validator: Callable,
+    result: Any,
+    expect_validation_error: bool,
+) -> List[Tuple]:
+    """Run the execution-phase validator on a fixture's result and return the failures."""
+    failures: List[Tuple] = []
+    try:
+        # Fixtures that validate their own result (with_property_values
+        # from validators_fix) already ran the validator during execute.
+        # Compared with "is True" since Mock auto-attributes are truthy.
+        if getattr(marked_func, "_validates_result", False) is not True:
+            # Pass the result and False to indicate execution phase
+            validator(result, False)
+
+        # If we expected a validation error but didn't get one
+        if expect_validation_error:
+            failures.append(
+                (
+                    fixturedef,
+                    AssertionError(
+                        "Expected validation error but none occurred during execution phase"
+                    ),
+                    "No validation error during execution phase",
+                )
+            )
+    except Exception as e:
+        # If we were expecting an error, this is good
+        _record_unexpected_error(failures, fixturedef, e, expect_validation_error)
+    return failures
+
+
+def _record_unexpected_error(
+    failed_fixtures: List[Tuple],
+    fixturedef: Any,
+    error: Exception,
+    expect_validation_error: Any,
+) -> None:
+    """Record an error raised while validating a fixture, unless one was expected.
+
+    Must be called from the ``except`` block handling *error*. The traceback is
+    only formatted for errors that will actually be reported.
+    """
+    if not expect_validation_error:
+        failed_fixtures.append((fixturedef, error, traceback.format_exc()))
+
+
+def _index_items_by_fixture(
+    items: List[Any], fixture_names: Optional[Set[str]] = None
+) -> Dict[str, List[Any]]:
+    """Map each fixture name to the collected test items that use it.
+
+    If ``fixture_names`` is given, only those fixtures are indexed.
+    """
+    # defaultdict avoids allocating a throwaway list per (item, fixture) pair,
+    # which dict.setdefault(name, []) would do
+    fixture_to_items: Dict[str, List[Any]] = defaultdict(list)
+    for item in items:
+        # Dedupe per item so a repeated name can't mark the same test twice
+        if fixture_names is None:
+            names = frozenset(item.fixturenames)
+        else:
+            names = fixture_names.intersection(item.fixturenames)
+        for name in names:
+            fixture_to_items[name].append(item)
+    return fixture_to_items
+
+
+def _mark_dependent_tests_for_skip(
+    session: Any,
+    fixturedef: Any,
+    error: Exception,
+    fixture_to_items: Optional[Dict[str, List[Any]]] = None,
+) -> None:
+    """Mark tests that depend on the failing fixture for skipping.
+
+    Pass a prebuilt ``fixture_to_items`` index (see _index_items_by_fixture) when
+    marking for several fixtures, so session.items is only scanned once.
+    """
     fixture_name = fixturedef.argname
+    if fixture_to_items is None:
+        fixture_to_items = _index_items_by_fixture(session.items)
 
     # Create a skip marker with the error message
     skip_marker = pytest.mark.skip(
@@ -271,28 +465,44 @@ def _mark_dependent_tests_for_skip(session: Any, fixturedef: Any, error: Excepti
     )
 
     # Apply the marker to tests that use this fixture
-    for item in session.items:
-        if fixture_name in item.fixturenames:
-            item.add_marker(skip_marker)
+    for item in fixture_to_items.get(fixture_name, ()):
+        item.add_marker(skip_marker)
+
+
+def _fixture_location(func: Any) -> str:
+    """Return ``file:lineno`` for the fixture function behind *func*.
+
+    Plain functions are located from their code object, which needs no source
+    file I/O; other callables fall back to inspect.
+    """
+    try:
+        func = inspect.unwrap(func)
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            return f"{code.co_filename}:{code.co_firstlineno}"
+        return f"{inspect.getfile(func)}:{inspect.getsourcelines(func)[1]}"
+    except (TypeError, OSError, ValueError):
+        return "<unknown location>"
 
 
 def report_fixture_errors(failed_fixtures: List[Tuple]) -> None:
-    """Format and print errors for any fixtures that failed validation."""
-    print("\n" + "=" * 80)
-    print("FIXTURE VALIDATION ERRORS")
-    print("=" * 80)
+    """Format and print errors for any fixtures that failed validation.
+
+    The report is assembled in memory and written to stdout in one call.
+    """
+    out: List[str] = ["\n" + "=" * 80, "FIXTURE VALIDATION ERRORS", "=" * 80]
+    # A fixture can fail in both the collection and execution phases; locate it once
+    locations: Dict[int, str] = {}
 
     for fixturedef, error, tb in failed_fixtures:
         fixture_name = fixturedef.argname
-        try:
-            fixture_file = inspect.getfile(fixturedef.func)
-            fixture_lineno = inspect.getsourcelines(fixturedef.func)[1]
-            location = f"{fixture_file}:{fixture_lineno}"
-        except (TypeError, OSError):
-            location = "<unknown location>"
+        func = fixturedef.func
+        location = locations.get(id(func))
+        if location is None:
+            location = locations[id(func)] = _fixture_location(func)
 
-        print(f"\nFixture '{fixture_name}' in {location} failed validation:")
-        print(f"  {error.__class__.__name__}: {error}")
+        out.append(f"\nFixture '{fixture_name}' in {location} failed validation:")
+        out.append(f"  {error.__class__.__name__}: {error}")
 
         # Check if this is likely a user-defined validator error
         error_in_user_code = False
@@ -311,11 +521,11 @@ def report_fixture_errors(failed_fixtures: List[Tuple]) -> None:
                     import_error_file = (
                         user_paths[0].split('"')[1] if '"' in user_paths[0] else "<unknown file>"
                     )
-                    print(
+                    out.append(
                         "\n  POSSIBLE USER CODE ERROR: The import error appears to be in your code."
                     )
-                    print(f"  The error occurred in file: {import_error_file}")
-                    print(
+                    out.append(f"  The error occurred in file: {import_error_file}")
+                    out.append(
                         "  Check that all imports in your validator function are correct and the packages are installed."
                     )
 
@@ -323,30 +533,165 @@ def report_fixture_errors(failed_fixtures: List[Tuple]) -> None:
         if isinstance(tb, str) and tb.strip():
             # If it's a user code error, print a more helpful message
             if error_in_user_code and isinstance(error, ImportError):
-                print("\n  Traceback (most relevant parts):")
+                out.append("\n  Traceback (most relevant parts):")
                 for line in tb.splitlines()[1:]:
                     if "File" in line or "ImportError" in line:
-                        print(f"  {line}")
+                        out.append(f"  {line}")
             else:
                 # Standard traceback handling
                 for line in tb.splitlines()[1:]:
                     if line.strip() and not line.startswith("During"):
-                        print(f"  {line}")
+                        out.append(f"  {line}")
 
-    print("\n" + "=" * 80)
-    print("Fix these fixture issues before running your tests.")
+    out.append("\n" + "=" * 80)
+    out.append("Fix these fixture issues before running your tests.")
     if any(isinstance(error, ImportError) for _, error, _ in failed_fixtures):
-        print("\nIMPORT ERRORS DETECTED:")
-        print(
+        out.append("\nIMPORT ERRORS DETECTED:")
+        out.append(
             "  • If the import error is in your custom validator, ensure all required packages are installed."
         )
-        print(
+        out.append(
             "  • Custom validators should be defined in your own files, not in the pytest_fixturecheck package."
         )
-        print(
+        out.append(
             "  • For validator examples, see https://github.com/topiaruss/pytest-fixturecheck#property-validators"
         )
-    print("=" * 80)
+    out.append("=" * 80)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Decorator classification for the report/add helpers, keyed by the AST node
+# type of the decorator (after looking through any call) and its final name.
+_FIXTURE_NAME = "fixture"
+_FIXTURECHECK_NAME = "fixturecheck"
+_DECORATOR_KINDS = {
+    (ast.Name, _FIXTURE_NAME): _FIXTURE_NAME,
+    (ast.Attribute, _FIXTURE_NAME): _FIXTURE_NAME,
+    (ast.Name, _FIXTURECHECK_NAME): _FIXTURECHECK_NAME,
+    (ast.Attribute, _FIXTURECHECK_NAME): _FIXTURECHECK_NAME,
+}
+
+
+# Module and class level statements whose blocks still define names at that
+# scope, e.g. ``if HAS_DJANGO:`` or ``try: ... except ImportError:``
+_BLOCK_TYPES: Tuple[type, ...] = (ast.If, ast.Try, ast.With)
+if hasattr(ast, "TryStar"):
+    _BLOCK_TYPES += (ast.TryStar,)
+
+
+def _iter_funcdefs(body: List[ast.stmt]) -> Iterator[ast.FunctionDef]:
+    """Yield the function definitions at module or class scope in an AST body.
+
+    Fixtures can only be declared at those scopes, so function bodies are not
+    descended into; ``if``/``try``/``with`` blocks at those scopes are.
+    """
+    for node in body:
+        if isinstance(node, ast.FunctionDef):
+            yield node
+        elif isinstance(node, ast.ClassDef):
+            yield from _iter_funcdefs(node.body)
+        elif isinstance(node, _BLOCK_TYPES):
+            yield from _iter_funcdefs(node.body)
+            for handler in getattr(node, "handlers", ()):
+                yield from _iter_funcdefs(handler.body)
+            yield from _iter_funcdefs(getattr(node, "orelse", []))
+            yield from _iter_funcdefs(getattr(node, "finalbody", []))
+
+
+def _decorator_key(decorator: ast.expr) -> Tuple[type, Optional[str]]:
+    """Return the ``(node_type, name)`` key used to look a decorator up in _DECORATOR_KINDS.
+
+    ``@pytest.fixture(scope="module")`` is looked through to its callee, so it
+    classifies the same as a bare ``@pytest.fixture``.
+    """
+    node_type = type(decorator)
+    if node_type is ast.Call:
+        decorator = decorator.func
+        node_type = type(decorator)
+    if node_type is ast.Name:
+        return node_type, decorator.id
+    if node_type is ast.Attribute:
+        return node_type, decorator.attr
+    return node_type, None
+
+
+def _classify_decorators(
+    node: ast.FunctionDef,
+) -> Tuple[Optional[ast.expr], Optional[ast.expr]]:
+    """Return the first fixture decorator and first fixturecheck decorator of a function."""
+    fixture_decorator = None
+    fixturecheck_decorator = None
+    # Local aliases keep global/attribute lookups out of the per-decorator loop
+    kind_of = _DECORATOR_KINDS.get
+    key_of = _decorator_key
+    for decorator in node.decorator_list:
+        kind = kind_of(key_of(decorator))
+        if kind == _FIXTURE_NAME and fixture_decorator is None:
+            fixture_decorator = decorator
+        elif kind == _FIXTURECHECK_NAME and fixturecheck_decorator is None:
+            fixturecheck_decorator = decorator
+    return fixture_decorator, fixturecheck_decorator
+
+
+_ClassifiedFuncdef = Tuple[ast.FunctionDef, Optional[ast.expr], Optional[ast.expr]]
+
+
+@lru_cache(maxsize=64)
+def _classified_funcdefs(content: str) -> Tuple[_ClassifiedFuncdef, ...]:
+    """Parse content once and return ``(node, fixture_decorator, fixturecheck_decorator)`` per function.
+
+    The report runs several FixtureCheckPlugin queries over the same file
+    content, so the parsed and classified result is cached by content and
+    shared between them.  Callers must treat the returned nodes as read-only.
+    """
+    tree = ast.parse(content)
+    return tuple((node, *_classify_decorators(node)) for node in _iter_funcdefs(tree.body))
+
+
+# Constant types whose repr() matches ast.unparse output
+_SIMPLE_CONSTANT_TYPES = (str, int, float, bool, type(None))
+
+
+def _dotted_name(node: ast.expr) -> Optional[str]:
+    """Return ``a.b.c`` for a Name or a chain of Attributes ending in a Name, else None."""
+    parts = []
+    while type(node) is ast.Attribute:
+        parts.append(node.attr)
+        node = node.value
+    if type(node) is not ast.Name:
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _simple_source(node: ast.expr) -> Optional[str]:
+    """Render a dotted name or plain constant as source, or return None."""
+    if type(node) is ast.Constant:
+        if not isinstance(node.value, _SIMPLE_CONSTANT_TYPES):
+            return None
+        text = repr(node.value)
+        # ast.unparse picks quotes to avoid escapes, so leave those cases to it
+        return None if "\\" in text else text
+    return _dotted_name(node)
+
+
+def _simple_call_source(node: ast.Call) -> Optional[str]:
+    """Render ``func(arg, key=value)`` with simple arguments as source, or return None."""
+    func = _dotted_name(node.func)
+    if func is None:
+        return None
+    parts = []
+    for arg in node.args:
+        text = _simple_source(arg)
+        if text is None:
+            return None
+        parts.append(text)
+    for keyword in node.keywords:
+        text = _simple_source(keyword.value)
+        if keyword.arg is None or text is None:
+            return None
+        parts.append(f"{keyword.arg}={text}")
+    return f"{func}({', '.join(parts)})"
 
 
 class FixtureCheckPlugin:
@@ -360,273 +705,162 @@ class FixtureCheckPlugin:
     def count_opportunities(self, content: str) -> int:
         """Count the number of fixtures that could benefit from fixturecheck."""
         opportunities = 0
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if this is a fixture
-                is_fixture = False
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            if decorator.func.id in [
-                                "fixture",
-                                "pytest.fixture",
-                                "pytest_asyncio.fixture",
-                            ]:
-                                is_fixture = True
-                                break
-                        elif isinstance(decorator.func, ast.Attribute):
-                            if decorator.func.attr == "fixture":
-                                is_fixture = True
-                                break
-                    elif isinstance(decorator, ast.Name):
-                        if decorator.id in [
-                            "fixture",
-                            "pytest.fixture",
-                            "pytest_asyncio.fixture",
-                        ]:
-                            is_fixture = True
-                            break
-                    elif isinstance(decorator, ast.Attribute):
-                        if decorator.attr == "fixture":
-                            is_fixture = True
-                            break
-
-                if is_fixture:
-                    # Check if it already has fixturecheck
-                    has_fixturecheck = False
-                    for decorator in node.decorator_list:
-                        if isinstance(decorator, ast.Call):
-                            if isinstance(decorator.func, ast.Name):
-                                if decorator.func.id == "fixturecheck":
-                                    has_fixturecheck = True
-                                    break
-
-                    if not has_fixturecheck:
-                        opportunities += 1
+
+        for _, fixture_decorator, fixturecheck_decorator in _classified_funcdefs(content):
+            if fixture_decorator is not None and fixturecheck_decorator is None:
+                opportunities += 1
 
         return opportunities
 
     def count_existing_checks(self, content: str) -> int:
         """Count the number of existing fixture checks."""
         existing_checks = 0
-        tree = ast.parse(content)
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            if decorator.func.id == "fixturecheck":
-                                existing_checks += 1
-                                break
+        for _, _, fixturecheck_decorator in _classified_funcdefs(content):
+            if fixturecheck_decorator is not None:
+                existing_checks += 1
 
         return existing_checks
 
     def get_opportunities_details(self, content: str, filename: str) -> List[Dict[str, Any]]:
         """Get detailed information about fixtures that could benefit from fixturecheck."""
         details = []
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if this is a fixture
-                is_fixture = False
-                fixture_decorator = None
-
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            if decorator.func.id in [
-                                "fixture",
-                                "pytest.fixture",
-                                "pytest_asyncio.fixture",
-                            ]:
-                                is_fixture = True
-                                fixture_decorator = decorator
-                                break
-                        elif isinstance(decorator.func, ast.Attribute):
-                            if decorator.func.attr == "fixture":
-                                is_fixture = True
-                                fixture_decorator = decorator
-                                break
-                    elif isinstance(decorator, ast.Name):
-                        if decorator.id in [
-                            "fixture",
-                            "pytest.fixture",
-                            "pytest_asyncio.fixture",
-                        ]:
-                            is_fixture = True
-                            fixture_decorator = decorator
-                            break
-                    elif isinstance(decorator, ast.Attribute):
-                        if decorator.attr == "fixture":
-                            is_fixture = True
-                            fixture_decorator = decorator
-                            break
-
-                if is_fixture:
-                    # Check if it already has fixturecheck
-                    has_fixturecheck = False
-                    for decorator in node.decorator_list:
-                        if isinstance(decorator, ast.Call):
-                            if isinstance(decorator.func, ast.Name):
-                                if decorator.func.id == "fixturecheck":
-                                    has_fixturecheck = True
-                                    break
-
-                    if not has_fixturecheck:
-                        # Extract function parameters
-                        params = [arg.arg for arg in node.args.args]
-
-                        detail = {
-                            "name": node.name,
-                            "line_number": node.lineno,
-                            "params": params,
-                            "filename": filename,
-                            "validator": None,  # No validator for opportunities
-                        }
-                        details.append(detail)
+
+        for node, fixture_decorator, fixturecheck_decorator in _classified_funcdefs(content):
+            if fixture_decorator is not None and fixturecheck_decorator is None:
+                # Extract function parameters
+                params = [arg.arg for arg in node.args.args]
+
+                detail = {
+                    "name": node.name,
+                    "line_number": node.lineno,
+                    "params": params,
+                    "filename": filename,
+                    "validator": None,  # No validator for opportunities
+                }
+                details.append(detail)
 
         return details
 
     def get_existing_checks_details(self, content: str, filename: str) -> List[Dict[str, Any]]:
         """Get detailed information about existing fixture checks."""
         details = []
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if this function has fixturecheck decorator
-                fixturecheck_decorator = None
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            if decorator.func.id == "fixturecheck":
-                                fixturecheck_decorator = decorator
-                                break
-
-                if fixturecheck_decorator:
-                    # Extract function parameters
-                    params = [arg.arg for arg in node.args.args]
-
-                    # Extract validator information
-                    validator_info = self._extract_validator_info(fixturecheck_decorator)
-
-                    detail = {
-                        "name": node.name,
-                        "line_number": node.lineno,
-                        "params": params,
-                        "filename": filename,
-                        "validator": validator_info,
-                    }
-                    details.append(detail)
+
+        for node, _, fixturecheck_decorator in _classified_funcdefs(content):
+            if fixturecheck_decorator is not None:
+                # Extract function parameters
+                params = [arg.arg for arg in node.args.args]
+
+                # Extract validator information
+                validator_info = self._extract_validator_info(fixturecheck_decorator)
+
+                detail = {
+                    "name": node.name,
+                    "line_number": node.lineno,
+                    "params": params,
+                    "filename": filename,
+                    "validator": validator_info,
+                }
+                details.append(detail)
 
         return details
 
-    def _extract_validator_info(self, decorator: ast.Call) -> Optional[str]:
+    def analyze(
+        self, path: Union[str, Path], pattern: str = "test_*.py", details: bool = False
+    ) -> Dict[str, Any]:
+        """Scan the test files under path and count their fixtures.
+
+        Returns a dict with the total ``opportunities`` and ``existing`` check
+        counts, and ``files``: one entry per scanned file holding its ``path``,
+        its ``content`` and its own ``opportunities``/``existing`` counts.  With
+        ``details=True`` each entry also carries the ``opportunity_details`` and
+        ``existing_details`` lists from the ``get_*_details`` methods.
+        """
+        test_files = find_test_files(Path(path), pattern)
+        if len(test_files) > 1:
+            # Files are read and parsed independently, so the file reads can
+            # overlap; map() keeps the results in file order
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(test_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                files = list(executor.map(self._analyze_file, test_files, repeat(details)))
+        else:
+            files = [self._analyze_file(test_file, details) for test_file in test_files]
+        return {
+            "opportunities": sum(entry["opportunities"] for entry in files),
+            "existing": sum(entry["existing"] for entry in files),
+            "files": files,
+        }
+
+    def _analyze_file(self, test_file: Path, details: bool = False) -> Dict[str, Any]:
+        """Read one test file and count its fixtures, optionally with their details."""
+        with open(test_file) as f:
+            content = f.read()
+
+        entry: Dict[str, Any] = {
+            "path": test_file,
+            "content": content,
+            "opportunities": self.count_opportunities(content),
+            "existing": self.count_existing_checks(content),
+        }
+        if details:
+            filename = str(test_file)
+            entry["opportunity_details"] = self.get_opportunities_details(content, filename)
+            entry["existing_details"] = self.get_existing_checks_details(content, filename)
+        return entry
+
+    def _extract_validator_info(self, decorator: ast.expr) -> Optional[str]:
         """Extract validator information from a fixturecheck decorator."""
-        if not decorator.args:
+        if type(decorator) is not ast.Call or not decorator.args:
             return "Default validator"
 
         # Get the first argument (the validator)
         validator_arg = decorator.args[0]
 
-        if isinstance(validator_arg, ast.Name):
-            return validator_arg.id
-        elif isinstance(validator_arg, ast.Attribute):
-            return (
-                ast.unparse(validator_arg) if hasattr(ast, "unparse") else f"{validator_arg.attr}"
-            )
-        elif isinstance(validator_arg, ast.Call):
-            if hasattr(ast, "unparse"):
-                return ast.unparse(validator_arg)
-            else:
-                # Fallback for older Python versions
-                if isinstance(validator_arg.func, ast.Name):
-                    return f"{validator_arg.func.id}(...)"
-                else:
-                    return "Complex validator call"
+        # Names, dotted names and simple calls are rendered directly; ast.unparse
+        # re-walks the subtree and is only needed for anything more complex.
+        if type(validator_arg) is ast.Call:
+            source = _simple_call_source(validator_arg)
         else:
-            if hasattr(ast, "unparse"):
-                return ast.unparse(validator_arg)
-            else:
-                return "Custom validator"
+            source = _simple_source(validator_arg)
+        if source is not None:
+            return source
+
+        if hasattr(ast, "unparse"):
+            return ast.unparse(validator_arg)
+
+        # Fallback for older Python versions
+        if isinstance(validator_arg, ast.Call):
+            if isinstance(validator_arg.func, ast.Name):
+                return f"{validator_arg.func.id}(...)"
+            return "Complex validator call"
+        return "Custom validator"
 
     def add_fixture_checks(self, content: str) -> str:
         """Add fixturecheck decorators to fixtures that don't have them."""
-        tree = ast.parse(content)
-        lines = content.splitlines()
-
-        # Track which lines need fixturecheck added
-        lines_to_add = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if this is a fixture and if it already has fixturecheck
-                is_fixture = False
-                fixture_decorator_line = None
-                has_fixturecheck = False
-
-                for decorator in node.decorator_list:
-                    # Check for fixturecheck decorators first
-                    fixturecheck_found = False
-                    if isinstance(decorator, ast.Call):
-                        if (
-                            isinstance(decorator.func, ast.Name)
-                            and decorator.func.id == "fixturecheck"
-                        ):
-                            fixturecheck_found = True
-                        elif (
-                            isinstance(decorator.func, ast.Attribute)
-                            and decorator.func.attr == "fixturecheck"
-                        ):
-                            fixturecheck_found = True
-                    elif isinstance(decorator, ast.Name) and decorator.id == "fixturecheck":
-                        fixturecheck_found = True
-                    elif isinstance(decorator, ast.Attribute) and decorator.attr == "fixturecheck":
-                        fixturecheck_found = True
-
-                    if fixturecheck_found:
-                        has_fixturecheck = True
-                        continue
-
-                    # Check for fixture decorators
-                    if isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            if decorator.func.id in [
-                                "fixture",
-                                "pytest.fixture",
-                                "pytest_asyncio.fixture",
-                            ]:
-                                is_fixture = True
-                                fixture_decorator_line = decorator.lineno
-                        elif isinstance(decorator.func, ast.Attribute):
-                            if decorator.func.attr == "fixture":
-                                is_fixture = True
-                                fixture_decorator_line = decorator.lineno
-                    elif isinstance(decorator, ast.Name):
-                        if decorator.id in [
-                            "fixture",
-                            "pytest.fixture",
-                            "pytest_asyncio.fixture",
-                        ]:
-                            is_fixture = True
-                            fixture_decorator_line = decorator.lineno
-                    elif isinstance(decorator, ast.Attribute):
-                        if decorator.attr == "fixture":
-                            is_fixture = True
-                            fixture_decorator_line = decorator.lineno
-
-                # Only add fixturecheck if it's a fixture and doesn't already have it
-                if is_fixture and not has_fixturecheck and fixture_decorator_line is not None:
-                    # Insert after the fixture decorator
-                    insert_line = fixture_decorator_line
-                    lines_to_add.append((insert_line, "@fixturecheck()"))
-
-        # Add the decorators in reverse order to maintain line numbers
-        for line_num, decorator in sorted(lines_to_add, reverse=True):
-            lines.insert(line_num, decorator)
-
-        return "\n".join(lines)
+        classified = _classified_funcdefs(content)
+        lines = content.splitlines(keepends=True)
+
+        # Map the line number each fixture decorator ends on to the text to insert after it
+        lines_to_add: Dict[int, str] = {}
+
+        for _, fixture_decorator, fixturecheck_decorator in classified:
+            # Only add fixturecheck if it's a fixture and doesn't already have it
+            if fixture_decorator is not None and fixturecheck_decorator is None:
+                # Insert after the fixture decorator, matching its indentation
+                decorator_line = lines[fixture_decorator.lineno - 1]
+                indent = decorator_line[: len(decorator_line) - len(decorator_line.lstrip())]
+                lines_to_add[fixture_decorator.end_lineno] = f"{indent}@fixturecheck()"
+
+        if not lines_to_add:
+            return content
+
+        # Merge the new decorators into the original lines in a single pass
+        out = io.StringIO()
+        for line_num, line in enumerate(lines, 1):
+            out.write(line)
+            decorator = lines_to_add.get(line_num)
+            if decorator is not None:
+                line_ending = line[len(line.rstrip("\r\n")) :] or "\n"
+                out.write(decorator + line_ending)
+
+        return out.getvalue()
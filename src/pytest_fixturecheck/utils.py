@@ -1,7 +1,9 @@
 """Utility functions for pytest-fixturecheck."""
 
+import functools
 import inspect
 from pathlib import Path
+from types import CoroutineType, FunctionType
 from typing import Any, Callable, List, TypeVar
 
 # Type variables for better typing
@@ -10,6 +12,12 @@ ValidatorFunc = Callable[[Any], None]
 PhaseAwareValidatorFunc = Callable[[Any, bool], None]
 
 
+def _mark_validator(fn: F) -> F:
+    """Mark fn as a phase-aware validator and return it."""
+    fn._is_pytest_fixturecheck_validator = True  # type: ignore
+    return fn
+
+
 def creates_validator(func: Callable) -> Callable:
     """Create a validator function from a function that performs validation.
 
@@ -47,7 +55,16 @@ def creates_validator(func: Callable) -> Callable:
         # def other_fixture(): ...
     """
 
-    import functools  # Import locally to avoid unused import warning
+    # Decorating the same function again reuses the factory built the first time.
+    # The function is stored alongside it because functools.wraps copies this
+    # attribute onto wrappers of func, which need a factory of their own.
+    cached = getattr(func, "_pytest_fixturecheck_factory", None)
+    if isinstance(cached, tuple) and cached[0] is func:
+        return cached[1]
+
+    # The decorated function's signature can't change, so read it once here
+    # rather than every time the factory is called
+    func_param_count = len(inspect.signature(func).parameters)
 
     @functools.wraps(func)
     def validator_factory(*factory_args: Any, **factory_kwargs: Any) -> Callable[[Any, bool], None]:
@@ -58,27 +75,24 @@ def creates_validator(func: Callable) -> Callable:
         """
         # Get the inner validator from the decorated function
         # Check if the function expects arguments and handle accordingly
-        sig = inspect.signature(func)
 
         # Special case handling: If the function only has one parameter (obj) and is called with no args,
         # it's likely a direct validator function like in test_creates_validator_basic
-        if len(sig.parameters) == 1 and len(factory_args) == 0 and len(factory_kwargs) == 0:
+        if func_param_count == 1 and len(factory_args) == 0 and len(factory_kwargs) == 0:
             # This is a direct validator that takes an object to validate
             # We'll return a wrapper that calls this function directly with the object
             @functools.wraps(func)
             def direct_validator_wrapper(obj: Any, is_collection_phase: bool = False) -> None:
-                if is_collection_phase:
-                    return None  # Skip validation during collection phase
-
-                if inspect.isfunction(obj):
-                    # Skip validation for function objects
+                # Skip validation during collection phase and for function objects.
+                # type() identity matches inspect.isfunction without the extra call.
+                if is_collection_phase or type(obj) is FunctionType:
                     return None
 
                 # Call the original validator directly with the object
                 return func(obj)
 
             # Mark the validator function
-            direct_validator_wrapper._is_pytest_fixturecheck_validator = True  # type: ignore
+            _mark_validator(direct_validator_wrapper)
             direct_validator_wrapper._fixturecheck = True  # type: ignore
             direct_validator_wrapper._expect_validation_error = False  # type: ignore
 
@@ -86,14 +100,13 @@ def creates_validator(func: Callable) -> Callable:
 
         # If the function expects more than one parameter and no parameters were provided,
         # return a no-op validator to avoid errors
-        elif len(sig.parameters) > 1 and len(factory_args) == 0 and len(factory_kwargs) == 0:
+        elif func_param_count > 1 and len(factory_args) == 0 and len(factory_kwargs) == 0:
             # If the function requires multiple arguments but none were provided,
             # return a no-op validator instead of raising an error
             def noop_validator(obj: Any, is_collection_phase: bool = False) -> None:
                 return None
 
-            noop_validator._is_pytest_fixturecheck_validator = True  # type: ignore
-            return noop_validator
+            return _mark_validator(noop_validator)
 
         # Normal case - call the decorated function with any provided args
         inner_validator = func(*factory_args, **factory_kwargs)
@@ -104,8 +117,7 @@ def creates_validator(func: Callable) -> Callable:
             def noop_validator(obj: Any, is_collection_phase: bool = False) -> None:
                 return None
 
-            noop_validator._is_pytest_fixturecheck_validator = True  # type: ignore
-            return noop_validator
+            return _mark_validator(noop_validator)
 
         # If inner_validator already has the validator flag, return it directly
         if (
@@ -114,28 +126,34 @@ def creates_validator(func: Callable) -> Callable:
         ):
             return inner_validator
 
-        # Create a wrapper for the inner validator to make it phase-aware
-        @functools.wraps(inner_validator if hasattr(inner_validator, "__name__") else func)
-        def validator_wrapper(obj: Any, is_collection_phase: bool = False) -> None:
-            """The actual validator function that will be called by fixturecheck."""
-            if is_collection_phase:
-                return None  # Skip validation during collection phase
-
-            if inspect.isfunction(obj):
-                # Skip validation for function objects
-                return None
-
-            # Check if the inner validator expects is_collection_phase as a parameter
-            sig = inspect.signature(inner_validator)
-            if "is_collection_phase" in sig.parameters:
+        # Create a wrapper for the inner validator to make it phase-aware. The
+        # inner validator's signature is checked once here, and a wrapper that
+        # calls it the right way is picked, so validation itself doesn't branch.
+        wraps = functools.wraps(inner_validator if hasattr(inner_validator, "__name__") else func)
+        if "is_collection_phase" in inspect.signature(inner_validator).parameters:
+
+            @wraps
+            def validator_wrapper(obj: Any, is_collection_phase: bool = False) -> None:
+                """The actual validator function that will be called by fixturecheck."""
+                # Skip validation during collection phase and for function objects
+                if is_collection_phase or type(obj) is FunctionType:
+                    return None
                 # It expects the is_collection_phase parameter
                 return inner_validator(obj, is_collection_phase=is_collection_phase)
-            else:
+
+        else:
+
+            @wraps
+            def validator_wrapper(obj: Any, is_collection_phase: bool = False) -> None:
+                """The actual validator function that will be called by fixturecheck."""
+                # Skip validation during collection phase and for function objects
+                if is_collection_phase or type(obj) is FunctionType:
+                    return None
                 # It doesn't expect the is_collection_phase parameter
                 return inner_validator(obj)
 
         # Mark the validator function
-        validator_wrapper._is_pytest_fixturecheck_validator = True  # type: ignore
+        _mark_validator(validator_wrapper)
         validator_wrapper._fixturecheck = True  # type: ignore
         validator_wrapper._expect_validation_error = False  # type: ignore
 
@@ -144,6 +162,11 @@ def creates_validator(func: Callable) -> Callable:
     # Mark the factory function
     validator_factory._is_pytest_fixturecheck_creator = True  # type: ignore
 
+    try:
+        func._pytest_fixturecheck_factory = (func, validator_factory)  # type: ignore
+    except AttributeError:
+        pass  # e.g. bound methods don't accept attributes; just don't cache
+
     return validator_factory
 
 
@@ -170,22 +193,14 @@ def is_coroutine(obj: Any) -> bool:
     Returns:
         True if the object is a coroutine, False otherwise
     """
-    return inspect.iscoroutine(obj)
-
-
-def is_excluded_path(path: Path) -> bool:
-    """Check if a path should be excluded from test file search.
-
-    Args:
-        path: The path to check
+    # Same check as inspect.iscoroutine, without the extra function call
+    return isinstance(obj, CoroutineType)
 
-    Returns:
-        True if the path should be excluded, False otherwise
-    """
-    path_parts = path.parts
 
-    # Exclude common virtual environment directories
-    venv_patterns = {
+# Directory names excluded from test file search
+_EXCLUDED_DIR_NAMES = frozenset(
+    {
+        # Common virtual environment directories
         ".venv",
         "venv",
         ".env",
@@ -194,10 +209,7 @@ def is_excluded_path(path: Path) -> bool:
         "virtualenv",
         ".pyenv",
         "pyenv",
-    }
-
-    # Exclude package/dependency directories
-    package_patterns = {
+        # Package/dependency directories
         "site-packages",
         "dist-packages",
         "node_modules",
@@ -217,10 +229,21 @@ def is_excluded_path(path: Path) -> bool:
         "htmlcov",
         "eggs",
     }
+)
 
+
+def is_excluded_path(path: Path) -> bool:
+    """Check if a path should be excluded from test file search.
+
+    Args:
+        path: The path to check
+
+    Returns:
+        True if the path should be excluded, False otherwise
+    """
     # Check if any part of the path matches exclusion patterns exactly
-    for part in path_parts:
-        if part in venv_patterns or part in package_patterns:
+    for part in path.parts:
+        if part in _EXCLUDED_DIR_NAMES:
             return True
         # Handle egg-info pattern with wildcard
         if part.endswith(".egg-info"):
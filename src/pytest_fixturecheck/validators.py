@@ -3,9 +3,18 @@
 This module provides factory functions for creating common validators.
 """
 
-import inspect
+from types import FunctionType
 from typing import Any, Callable, Tuple, Type, Union
 
+from .utils import _mark_validator
+
+# Default for getattr, so one lookup both fetches an attribute and tells us it's missing
+_MISSING = object()
+
+
+class FixtureCheckWarning(UserWarning):
+    """Warning issued by validators created with strict=False."""
+
 
 def is_instance_of(
     type_or_types: Union[Type, Tuple[Type, ...]],
@@ -26,20 +35,26 @@ def is_instance_of(
             return User(...)
     """
 
-    def validator(obj: Any, is_collection_phase: bool = False) -> None:
-        if not isinstance(obj, type_or_types):
-            if isinstance(type_or_types, tuple):
-                type_names = ", ".join(t.__name__ for t in type_or_types)
+    # Whether a tuple of types was given can't change, so pick the
+    # matching validator now and build the expected name(s) up front
+    if isinstance(type_or_types, tuple):
+        type_names = ", ".join(t.__name__ for t in type_or_types)
+
+        def validator(obj: Any, is_collection_phase: bool = False) -> None:
+            if not isinstance(obj, type_or_types):
                 raise TypeError(
                     f"Expected instance of one of ({type_names}), got {type(obj).__name__}"
                 )
-            else:
-                raise TypeError(
-                    f"Expected instance of {type_or_types.__name__}, got {type(obj).__name__}"
-                )
-        validator._is_pytest_fixturecheck_validator = True
 
-    return validator
+    else:
+        # X | Y unions pass isinstance but have no __name__
+        type_name = getattr(type_or_types, "__name__", repr(type_or_types))
+
+        def validator(obj: Any, is_collection_phase: bool = False) -> None:
+            if not isinstance(obj, type_or_types):
+                raise TypeError(f"Expected instance of {type_name}, got {type(obj).__name__}")
+
+    return _mark_validator(validator)
 
 
 def has_required_fields(*field_names: str) -> Callable[[Any, bool], None]:
@@ -61,16 +76,17 @@ def has_required_fields(*field_names: str) -> Callable[[Any, bool], None]:
 
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
         # Skip validation during collection phase or if obj is a function
-        if is_collection_phase or inspect.isfunction(obj):
+        if is_collection_phase or type(obj) is FunctionType:
             return
 
         for field in field_names:
-            if not hasattr(obj, field):
+            value = getattr(obj, field, _MISSING)
+            if value is _MISSING:
                 raise AttributeError(
                     f"Required field '{field}' missing from {obj.__class__.__name__}"
                 )
 
-            if getattr(obj, field) is None:
+            if value is None:
                 raise ValueError(f"Required field '{field}' is None in {obj.__class__.__name__}")
 
     return validator
@@ -95,16 +111,16 @@ def has_required_methods(*method_names: str) -> Callable[[Any, bool], None]:
 
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
         for method in method_names:
-            if not hasattr(obj, method):
+            attr = getattr(obj, method, _MISSING)
+            if attr is _MISSING:
                 raise AttributeError(
                     f"Required method '{method}' missing from {obj.__class__.__name__}"
                 )
 
-            if not callable(getattr(obj, method)):
+            if not callable(attr):
                 raise TypeError(f"'{method}' is not callable in {obj.__class__.__name__}")
-        validator._is_pytest_fixturecheck_validator = True
 
-    return validator
+    return _mark_validator(validator)
 
 
 def has_property_values(**expected_values: Any) -> Callable[[Any, bool], None]:
@@ -124,19 +140,21 @@ def has_property_values(**expected_values: Any) -> Callable[[Any, bool], None]:
             return User(...)
     """
 
+    # A tuple of pairs is cheaper to iterate than the dict's items view
+    property_items = tuple(expected_values.items())
+
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
-        for prop_name, expected_value in expected_values.items():
-            if not hasattr(obj, prop_name):
+        for prop_name, expected_value in property_items:
+            actual_value = getattr(obj, prop_name, _MISSING)
+            if actual_value is _MISSING:
                 raise AttributeError(
                     f"Property '{prop_name}' missing from {obj.__class__.__name__}"
                 )
 
-            actual_value = getattr(obj, prop_name)
             if actual_value != expected_value:
                 raise ValueError(f"Expected {prop_name}={expected_value}, got {actual_value}")
-        validator._is_pytest_fixturecheck_validator = True
 
-    return validator
+    return _mark_validator(validator)
 
 
 def combines_validators(*validators: Callable) -> Callable[[Any, bool], None]:
@@ -159,10 +177,14 @@ def combines_validators(*validators: Callable) -> Callable[[Any, bool], None]:
             return User(...)
     """
 
+    # A single marked validator needs no combining layer around it
+    if len(validators) == 1 and getattr(validators[0], "_is_pytest_fixturecheck_validator", False):
+        return validators[0]
+
     def combined_validator(obj: Any, is_collection_phase: bool = False) -> None:
+        # Each child decides for itself what to do in the collection phase, so a
+        # combination behaves the same as its single-validator shortcut above
         for validator in validators:
             validator(obj, is_collection_phase)
 
-        combined_validator._is_pytest_fixturecheck_validator = True
-
-    return combined_validator
+    return _mark_validator(combined_validator)
@@ -5,14 +5,21 @@ This module provides advanced validators for more complex validation scenarios.
 
 import typing
 import warnings
-from typing import Any, Callable, TypeVar
+from operator import attrgetter
+from typing import Any, Callable, TypeVar, cast
 
 # Import the fixturecheck function to prevent circular imports when using factory functions
 from .decorator import fixturecheck
+from .utils import _mark_validator
+from .validators import _MISSING, FixtureCheckWarning
 
 # Type variable for function annotations
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Suffix marking a type_check_properties keyword as a type spec
+_TYPE_SUFFIX = "__type"
+_TYPE_SUFFIX_LEN = len(_TYPE_SUFFIX)
+
 
 def nested_property_validator(**expected_values: Any) -> Callable[[Any, bool], None]:
     """
@@ -40,50 +47,80 @@ def nested_property_validator(**expected_values: Any) -> Callable[[Any, bool], N
     if "strict" in expected_values:
         strict = expected_values.pop("strict")
 
+    # Split nested paths once here rather than on every validation, and
+    # keep top-level properties apart so their loop needs no path handling
+    flat_checks = tuple(
+        (prop_path, expected_value)
+        for prop_path, expected_value in expected_values.items()
+        if "__" not in prop_path
+    )
+    # attrgetter walks a dotted path in one C call; the segments are kept
+    # to find the missing one when that walk fails
+    nested_checks = tuple(
+        (
+            prop_path,
+            tuple(prop_path.split("__")),
+            attrgetter(prop_path.replace("__", ".")),
+            expected_value,
+        )
+        for prop_path, expected_value in expected_values.items()
+        if "__" in prop_path
+    )
+
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
         if is_collection_phase:
             return
-        for prop_path, expected_value in expected_values.items():
-            if "__" in prop_path:
-                segments = prop_path.split("__")
-                current = obj
-                for i, segment in enumerate(segments):
-                    if not hasattr(current, segment):
-                        error_msg = f"Property '{segment}' missing from object at path '{'.'.join(segments[:i])}'"
-                        if strict:
-                            raise AttributeError(error_msg)
-                        else:
-                            warnings.warn(error_msg, stacklevel=2)
-                            break
-                    if i == len(segments) - 1:
-                        actual_value = getattr(current, segment)
-                        if actual_value != expected_value:
-                            error_msg = f"Expected {prop_path}={expected_value}, got {actual_value}"
-                            if strict:
-                                raise ValueError(error_msg)
-                            else:
-                                warnings.warn(error_msg, stacklevel=2)
+        for prop_path, expected_value in flat_checks:
+            actual_value = getattr(obj, prop_path, _MISSING)
+            if actual_value is _MISSING:
+                error_msg = f"Property '{prop_path}' missing from {obj.__class__.__name__}"
+                if strict:
+                    raise AttributeError(error_msg)
+                else:
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
+                    continue
+            if actual_value != expected_value:
+                error_msg = f"Expected {prop_path}={expected_value}, got {actual_value}"
+                if strict:
+                    raise ValueError(error_msg)
+                else:
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
+        for prop_path, segments, getter, expected_value in nested_checks:
+            try:
+                actual_value = getter(obj)
+            except AttributeError:
+                pass
+            else:
+                if actual_value != expected_value:
+                    error_msg = f"Expected {prop_path}={expected_value}, got {actual_value}"
+                    if strict:
+                        raise ValueError(error_msg)
                     else:
-                        current = getattr(current, segment)
-            else:  # Top-level properties
-                if not hasattr(obj, prop_path):
-                    error_msg = f"Property '{prop_path}' missing from {obj.__class__.__name__}"
+                        warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
+                continue
+
+            # Slow path: walk the segments again to report which one is missing
+            current = obj
+            for i, segment in enumerate(segments):
+                value = getattr(current, segment, _MISSING)
+                if value is _MISSING:
+                    error_msg = f"Property '{segment}' missing from object at path '{'.'.join(segments[:i])}'"
                     if strict:
                         raise AttributeError(error_msg)
                     else:
-                        warnings.warn(error_msg, stacklevel=2)
-                        continue
-                actual_value = getattr(obj, prop_path)
-                if actual_value != expected_value:
-                    error_msg = f"Expected {prop_path}={expected_value}, got {actual_value}"
+                        warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
+                        break
+                current = value
+            else:
+                if current != expected_value:
+                    error_msg = f"Expected {prop_path}={expected_value}, got {current}"
                     if strict:
                         raise ValueError(error_msg)
                     else:
-                        warnings.warn(error_msg, stacklevel=2)
+                        warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
         # Inner validator implicitly returns None on success, or raises error.
 
-    validator._is_pytest_fixturecheck_validator = True
-    return validator
+    return _mark_validator(validator)
 
 
 def type_check_properties(**expected_values: Any) -> Callable[[Any, bool], None]:
@@ -98,86 +135,92 @@ def type_check_properties(**expected_values: Any) -> Callable[[Any, bool], None]
     type_specs = {}
     value_specs = {}
     for key, value in expected_values.items():
-        if key.endswith("__type"):
-            prop_name = key[:-6]
-            type_specs[prop_name] = value
+        if key.endswith(_TYPE_SUFFIX):
+            type_specs[key[:-_TYPE_SUFFIX_LEN]] = value
         else:
             value_specs[key] = value
 
+    # Unpack Union types once here; the expected types are fixed for the
+    # lifetime of the validator. union_args is None for plain types.
+    type_checks = tuple(
+        (
+            prop_name,
+            expected_type,
+            typing.get_args(expected_type)
+            if typing.get_origin(expected_type) is typing.Union
+            else None,
+        )
+        for prop_name, expected_type in type_specs.items()
+    )
+    # Frozen into a tuple as well, so each call iterates plain pairs
+    value_checks = tuple(value_specs.items())
+
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
         if is_collection_phase:
             return
         # Validate property values
-        for prop_name, expected_value in value_specs.items():
-            if not hasattr(obj, prop_name):
+        for prop_name, expected_value in value_checks:
+            actual_value = getattr(obj, prop_name, _MISSING)
+            if actual_value is _MISSING:
                 error_msg = f"Property '{prop_name}' missing from {obj.__class__.__name__}"
                 if strict:
                     raise AttributeError(error_msg)
                 else:
-                    warnings.warn(error_msg, stacklevel=2)
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
                     continue
-            actual_value = getattr(obj, prop_name)
             if actual_value != expected_value:
                 error_msg = f"Expected {prop_name}={expected_value}, got {actual_value}"
                 if strict:
                     raise ValueError(error_msg)
                 else:
-                    warnings.warn(error_msg, stacklevel=2)
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
         # Validate property types
-        for prop_name, expected_type in type_specs.items():
-            if not hasattr(obj, prop_name):
+        for prop_name, expected_type, union_args in type_checks:
+            actual_value = getattr(obj, prop_name, _MISSING)
+            if actual_value is _MISSING:
                 error_msg = f"Property '{prop_name}' missing from {obj.__class__.__name__}"
                 if strict:
                     raise AttributeError(error_msg)
                 else:
-                    warnings.warn(error_msg, stacklevel=2)
-                    continue
-            actual_value = getattr(obj, prop_name)
-            if hasattr(typing, "get_origin") and hasattr(typing, "get_args"):  # Handle Union types
-                origin = typing.get_origin(expected_type)
-                if origin is typing.Union:
-                    type_args = typing.get_args(expected_type)
-                    if not any(isinstance(actual_value, t) for t in type_args):
-                        error_msg = f"Expected {prop_name} to be one of types {type_args}, got {type(actual_value)}"
-                        if strict:
-                            raise TypeError(error_msg)
-                        else:
-                            warnings.warn(error_msg, stacklevel=2)
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
                     continue
+            if union_args is not None:  # Handle Union types
+                # isinstance takes the tuple of member types directly
+                if not isinstance(actual_value, union_args):
+                    error_msg = f"Expected {prop_name} to be one of types {union_args}, got {type(actual_value)}"
+                    if strict:
+                        raise TypeError(error_msg)
+                    else:
+                        warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
+                continue
             if not isinstance(actual_value, expected_type):
                 error_msg = f"Expected {prop_name} to be of type {expected_type.__name__}, got {type(actual_value).__name__}"
                 if strict:
                     raise TypeError(error_msg)
                 else:
-                    warnings.warn(error_msg, stacklevel=2)
+                    warnings.warn(error_msg, FixtureCheckWarning, stacklevel=2)
         # Inner validator implicitly returns None on success, or raises error.
 
-    validator._is_pytest_fixturecheck_validator = True
-    return validator
-
+    return _mark_validator(validator)
 
-class _SimpleValidatorCallable:
-    def __init__(self, func_to_call: Callable[[Any], None]):
-        self.func_to_call = func_to_call
-        self.__name__ = getattr(func_to_call, "__name__", "_simple_validator_instance")
-        self.__doc__ = getattr(func_to_call, "__doc__", "")
-        self._is_pytest_fixturecheck_validator = True  # Mark the instance
 
-    def __call__(self, obj: Any, is_collection_phase: bool = False) -> None:
-        if is_collection_phase:
-            return
-        try:
-            self.func_to_call(obj)
-        except Exception:
-            raise
-
-
-def simple_validator(func: Callable[[Any], None]) -> _SimpleValidatorCallable:
+def simple_validator(func: Callable[[Any], None]) -> Callable[[Any, bool], None]:
     """
     Decorator to easily create a validator from a simple function.
     The decorated function should take the fixture object and raise an error if invalid.
     """
-    return _SimpleValidatorCallable(func)
+    # Already a phase-aware validator; wrapping it again would only add a call
+    if getattr(func, "_is_pytest_fixturecheck_validator", False):
+        return cast(Callable[[Any, bool], None], func)
+
+    def validator(obj: Any, is_collection_phase: bool = False) -> None:
+        if is_collection_phase:
+            return
+        func(obj)
+
+    validator.__name__ = getattr(func, "__name__", "_simple_validator_instance")
+    validator.__doc__ = getattr(func, "__doc__", "")
+    return _mark_validator(validator)
 
 
 def with_nested_properties(
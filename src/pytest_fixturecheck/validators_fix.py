@@ -7,6 +7,11 @@ import functools
 import warnings
 from typing import Any, Callable, Dict
 
+# decorator imports this module, so bind the module rather than fixturecheck
+# itself; the attribute exists by the time with_property_values is called
+from . import decorator as _decorator_module
+from .validators import _MISSING, FixtureCheckWarning
+
 
 def property_values_validator(
     expected_values: Dict[str, Any],
@@ -34,24 +39,30 @@ def property_values_validator(
     if "strict" in expected_values:
         strict = expected_values.pop("strict")
 
+    # Snapshot the pairs as a tuple, which is cheaper to loop over than the
+    # dict and unaffected by later changes to the caller's dictionary
+    property_items = tuple(expected_values.items())
+
     def validator(obj: Any, is_collection_phase: bool = False) -> None:
         # Skip validation during collection phase
         if is_collection_phase:
             return
 
-        for prop_name, expected_value in expected_values.items():
-            if not hasattr(obj, prop_name):
+        for prop_name, expected_value in property_items:
+            actual_value = getattr(obj, prop_name, _MISSING)
+            if actual_value is _MISSING:
                 raise AttributeError(
                     f"Property '{prop_name}' missing from {obj.__class__.__name__}"
                 )
 
-            actual_value = getattr(obj, prop_name)
             if actual_value != expected_value:
                 if strict:
                     raise ValueError(f"Expected {prop_name}={expected_value}, got {actual_value}")
                 else:
                     warnings.warn(
-                        f"Expected {prop_name}={expected_value}, got {actual_value}", stacklevel=2
+                        f"Expected {prop_name}={expected_value}, got {actual_value}",
+                        FixtureCheckWarning,
+                        stacklevel=2,
                     )
 
     return validator
@@ -110,8 +121,6 @@ def with_property_values(**expected_values: Any) -> Callable:
         def fixture():
             return TestObject()
     """
-    from .decorator import fixturecheck
-
     # Create the validator function
     validator = property_values_validator(expected_values)
 
@@ -119,7 +128,7 @@ def with_property_values(**expected_values: Any) -> Callable:
     # and performs validation when called directly
     def decorator(fixture_func):
         # Use fixturecheck to mark for pytest validation
-        decorated = fixturecheck(validator)(fixture_func)
+        decorated = _decorator_module.fixturecheck(validator)(fixture_func)
 
         # Add direct validation for tests calling the function directly
         @functools.wraps(decorated)
@@ -133,6 +142,8 @@ def with_property_values(**expected_values: Any) -> Callable:
         wrapper._fixturecheck = decorated._fixturecheck
         wrapper._validator = decorated._validator
         wrapper._expect_validation_error = decorated._expect_validation_error
+        # The plugin executes this wrapper, so it needn't validate the result again
+        wrapper._validates_result = True
 
         return wrapper
 
@@ -0,0 +1,56 @@
+"""Plain model classes shared by the validator tests.
+
+Kept out of the ``test_*`` modules so the classes are defined once and
+pytest doesn't rewrite this module's asserts.
+"""
+
+from typing import Any, List, Optional
+
+
+class MyTestObject:
+    def __init__(self, name: str, value: Any):
+        self.name = name
+        self.value = value
+
+
+class Config:
+    def __init__(self, resolution: str, frame_rate: int):
+        self.resolution = resolution
+        self.frame_rate = frame_rate
+
+
+class Camera:
+    def __init__(self, name: str, config: Config):
+        self.name = name
+        self.config = config
+        self.is_active = True
+
+
+class User:
+    def __init__(
+        self,
+        username: Any,
+        email: Optional[str] = None,
+        age: Any = None,
+        is_active: bool = True,
+        roles: Optional[List[str]] = None,
+    ):
+        self.username = username
+        self.email = email
+        self.age = age
+        self.is_active = is_active
+        self.roles = roles or []
+
+
+class Address:
+    def __init__(self, street: str, city: str):
+        self.street = street
+        self.city = city
+
+
+class AdvUser:
+    def __init__(self, username: str, email: str, age: int, address: Optional[Address] = None):
+        self.username = username
+        self.email = email
+        self.age = age
+        self.address = address
@@ -1,6 +1,6 @@
 """Test configuration for pytest-fixturecheck."""
 
-import inspect
+from types import FunctionType
 
 import pytest
 
@@ -31,8 +31,10 @@ except ImportError:
 
 
 from pytest_fixturecheck import fixturecheck, has_required_fields
-from pytest_fixturecheck.utils import creates_validator
 from pytest_fixturecheck.validators_advanced import nested_property_validator
+from pytest_fixturecheck.validators_fix import check_property_values
+
+from ._models import Camera, Config
 
 
 class User:
@@ -45,7 +47,7 @@ class User:
 # Custom validator function
 def validate_user(obj, is_collection_phase=False):
     """Validate that a user has a username."""
-    if is_collection_phase or inspect.isfunction(obj):
+    if is_collection_phase or type(obj) is FunctionType:
         return
     if not hasattr(obj, "username"):
         raise AttributeError("User must have a username")
@@ -53,39 +55,6 @@ def validate_user(obj, is_collection_phase=False):
         raise ValueError("Username cannot be None")
 
 
-# Fixed property values validator that works with a dictionary
-def conftest_property_values_validator(expected_values):
-    """
-    Create a validator that checks if the fixture has the expected property values.
-
-    Args:
-        expected_values: Dictionary of property names and their expected values
-
-    Returns:
-        A validator function
-    """
-
-    @creates_validator
-    def validator():
-        def inner_validator(obj, is_collection_phase=False):
-            if is_collection_phase:
-                return
-
-            for prop_name, expected_value in expected_values.items():
-                if not hasattr(obj, prop_name):
-                    raise AttributeError(
-                        f"Property '{prop_name}' missing from {obj.__class__.__name__}"
-                    )
-
-                actual_value = getattr(obj, prop_name)
-                if actual_value != expected_value:
-                    raise ValueError(f"Expected {prop_name}={expected_value}, got {actual_value}")
-
-        return inner_validator
-
-    return validator
-
-
 @pytest.fixture
 @fixturecheck(validate_user)
 def valid_user():
@@ -116,25 +85,12 @@ class TestObject:
 
 
 @pytest.fixture
-@fixturecheck(conftest_property_values_validator({"name": "fixture_test"}))
+@fixturecheck(check_property_values(name="fixture_test"))
 def property_fixture():
     """A fixture with specific property values."""
     return TestObject(name="fixture_test")
 
 
-# Added from test_advanced_validators_comprehensive.py for working_camera_fixture
-class Config:
-    def __init__(self, resolution: str, frame_rate: int):
-        self.resolution = resolution
-        self.frame_rate = frame_rate
-
-
-class Camera:
-    def __init__(self, name: str, config: Config):
-        self.name = name
-        self.config = config
-
-
 # Define the validator instance separately
 _working_camera_validator_instance = nested_property_validator(
     name="Test", config__resolution="1280x720", config__frame_rate=30
@@ -19,11 +19,13 @@ from pytest_fixturecheck import fixturecheck
 class User:
     """Mock User model."""
 
+    # Shared by all instances, like a real model's Options
+    _meta = type("_meta", (), {"get_field": lambda self, name: None})
+
     def __init__(self, username, email, is_active=True):
         self.username = username
         self.email = email
         self.is_active = is_active
-        self._meta = type("_meta", (), {"get_field": lambda self, name: None})
 
     def save(self):
         """Save the user."""
@@ -37,10 +39,12 @@ class User:
 class Book:
     """Mock Book model."""
 
+    # Shared by all instances, like a real model's Options
+    _meta = type("_meta", (), {"get_field": lambda self, name: None})
+
     def __init__(self, title, author):
         self.title = title
         self.author = author
-        self._meta = type("_meta", (), {"get_field": lambda self, name: None})
 
     def save(self):
         """Save the book."""
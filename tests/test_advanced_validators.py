@@ -11,28 +11,7 @@ from pytest_fixturecheck.validators_advanced import (
     with_type_checks,
 )
 
-
-# Test classes
-class Config:
-    def __init__(self, resolution, frame_rate):
-        self.resolution = resolution
-        self.frame_rate = frame_rate
-
-
-class Camera:
-    def __init__(self, name, config):
-        self.name = name
-        self.config = config
-        self.is_active = True
-
-
-class User:
-    def __init__(self, username, email=None, age=None, is_active=True, roles=None):
-        self.username = username
-        self.email = email
-        self.age = age
-        self.is_active = is_active
-        self.roles = roles or []
+from ._models import Camera, Config, User
 
 
 # Test fixtures using nested_property_validator
@@ -208,44 +187,73 @@ def test_simple_validator_success():
     assert simple_validated_user.username == "simple"
 
 
-@pytest.fixture
+def test_simple_validator_wraps_function():
+    """simple_validator keeps the function's name and skips the collection phase."""
+    seen = []
+
+    def check_user(obj):
+        """Check a user."""
+        seen.append(obj)
+
+    validator = simple_validator(check_user)
+    assert validator.__name__ == "check_user"
+    assert validator.__doc__ == "Check a user."
+    assert validator._is_pytest_fixturecheck_validator is True
+
+    validator("during collection", True)
+    validator("at execution", False)
+    assert seen == ["at execution"]
+
+
+def test_simple_validator_returns_marked_validator_unchanged():
+    """A function that is already a validator is returned as-is."""
+    validator = nested_property_validator(username="simple")
+    assert simple_validator(validator) is validator
+
+
+# Read-only objects shared by the direct tests below; built once per session
+@pytest.fixture(scope="session")
+def reference_camera():
+    return Camera("Test Camera", Config("1280x720", 30))
+
+
+@pytest.fixture(scope="session")
 def invalid_camera():
     """Camera with invalid properties for testing error cases."""
-    config = Config("wrong", 60)
-    return Camera("Wrong Name", config)
+    return Camera("Wrong Name", Config("wrong", 60))
 
 
-def test_nested_validator_direct():
-    """Test property access and validation manually instead of using the validator."""
-    camera_config = Config("1280x720", 30)
-    camera = Camera("Test Camera", camera_config)
+@pytest.fixture(scope="session")
+def reference_user():
+    return User("testuser", "test@example.com", 30)
+
+
+@pytest.fixture(scope="session")
+def wrong_type_user():
+    # username should be str, age should be int
+    return User(123, "test@example.com", "30")
+
 
+def test_nested_validator_direct(reference_camera, invalid_camera):
+    """Test property access and validation manually instead of using the validator."""
     # Manually check the same properties we would with the validator
-    assert camera.name == "Test Camera"
-    assert camera.config.resolution == "1280x720"
+    assert reference_camera.name == "Test Camera"
+    assert reference_camera.config.resolution == "1280x720"
 
     # Check that wrong values would be detected
-    wrong_config = Config("wrong", 60)
-    wrong_camera = Camera("Wrong Name", wrong_config)
+    assert invalid_camera.name != "Test Camera"
+    assert invalid_camera.config.resolution != "1280x720"
 
-    assert wrong_camera.name != "Test Camera"
-    assert wrong_camera.config.resolution != "1280x720"
 
-
-def test_type_validator_direct():
+def test_type_validator_direct(reference_user, wrong_type_user):
     """Test type checking manually instead of using the validator."""
-    user = User("testuser", "test@example.com", 30)
-
     # Check types directly
-    assert isinstance(user.username, str)
-    assert isinstance(user.email, str)
-    assert isinstance(user.age, int)
-
-    # Create an object with a wrong type
-    wrong_user = User(123, "test@example.com", "30")  # username should be str, age should be int
+    assert isinstance(reference_user.username, str)
+    assert isinstance(reference_user.email, str)
+    assert isinstance(reference_user.age, int)
 
     # Verify types are wrong
-    assert not isinstance(wrong_user.username, str)
-    assert isinstance(wrong_user.username, int)
-    assert not isinstance(wrong_user.age, int)
-    assert isinstance(wrong_user.age, str)
+    assert not isinstance(wrong_type_user.username, str)
+    assert isinstance(wrong_type_user.username, int)
+    assert not isinstance(wrong_type_user.age, int)
+    assert isinstance(wrong_type_user.age, str)
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union
+from typing import Optional, Union
 
 import pytest
 
@@ -15,38 +15,7 @@ from pytest_fixturecheck.validators_advanced import (
     with_type_checks,
 )
 
-
-# Class definitions first
-class MyTestObject:
-    def __init__(self, name: str, value: Any):
-        self.name = name
-        self.value = value
-
-
-class Config:
-    def __init__(self, resolution: str, frame_rate: int):
-        self.resolution = resolution
-        self.frame_rate = frame_rate
-
-
-class Camera:
-    def __init__(self, name: str, config: Config):
-        self.name = name
-        self.config = config
-
-
-class Address:
-    def __init__(self, street: str, city: str):
-        self.street = street
-        self.city = city
-
-
-class AdvUser:
-    def __init__(self, username: str, email: str, age: int, address: Optional[Address] = None):
-        self.username = username
-        self.email = email
-        self.age = age
-        self.address = address
+from ._models import Address, AdvUser, Camera, Config, MyTestObject
 
 
 # Then fixtures
@@ -266,6 +235,48 @@ class TestNestedPropertyValidator:
         # consumption, but that's tricky as fixturecheck does it during collection/setup.
         # For now, just ensuring the test runs and the fixture is usable is the main goal.
 
+    def test_flat_and_nested_paths_mixed(self):
+        validator = nested_property_validator(
+            config__frame_rate=30, name="Test", config__resolution="1280x720", strict=False
+        )
+        camera = Camera("Other", Config("640x480", 30))
+
+        with pytest.warns(UserWarning) as record:
+            validator(camera, False)
+
+        messages = sorted(str(w.message) for w in record)
+        assert messages == [
+            "Expected config__resolution=1280x720, got 640x480",
+            "Expected name=Test, got Other",
+        ]
+
+    def test_each_segment_read_once(self):
+        reads = []
+
+        class CountedConfig:
+            @property
+            def resolution(self):
+                reads.append("resolution")
+                return "1280x720"
+
+        class CountedCamera:
+            @property
+            def config(self):
+                reads.append("config")
+                return CountedConfig()
+
+        nested_property_validator(config__resolution="1280x720")(CountedCamera(), False)
+        assert reads == ["config", "resolution"]
+
+    def test_missing_segment_reported_by_name(self):
+        validator = nested_property_validator(config__lens__focal_length=35)
+        camera = Camera("Test", Config("1280x720", 30))
+
+        with pytest.raises(
+            AttributeError, match="Property 'lens' missing from object at path 'config'"
+        ):
+            validator(camera, False)
+
 
 class TestTypeCheckProperties:
     def test_valid_type_checks(self, valid_user_fixture):
@@ -285,6 +296,21 @@ class TestTypeCheckProperties:
         # For now, ensure this one passes.
         pass
 
+    def test_union_type_resolved_at_construction(self, monkeypatch):
+        import typing
+
+        validator = type_check_properties(email__type=Optional[str])
+
+        def fail(tp):
+            raise AssertionError("typing introspection during validation")
+
+        monkeypatch.setattr(typing, "get_origin", fail)
+        monkeypatch.setattr(typing, "get_args", fail)
+        validator(AdvUser("u", None, 1, None), False)
+        validator(AdvUser("u", "u@example.com", 1, None), False)
+        with pytest.raises(TypeError, match="to be one of types"):
+            validator(AdvUser("u", 42, 1, None), False)
+
     def test_missing_property(self, missing_property_user_fixture):
         # Fixture validation should raise AttributeError, and fixturecheck handles it.
         pass
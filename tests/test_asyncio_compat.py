@@ -1,18 +1,13 @@
 """Test file to verify compatibility with pytest-asyncio."""
 
-import asyncio
-import inspect
-
 import pytest
 
-# Try to import pytest_asyncio, skip tests if not available
-try:
-    import pytest_asyncio
+# Skip the module if pytest_asyncio isn't installed. This runs before the
+# other imports so a skipped module doesn't pay for them.
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
 
-    PYTEST_ASYNCIO_AVAILABLE = True
-except ImportError:
-    PYTEST_ASYNCIO_AVAILABLE = False
-    pytest.skip("pytest_asyncio not installed, skipping tests", allow_module_level=True)
+import asyncio
+import inspect
 
 from pytest_fixturecheck import fixturecheck
 
@@ -24,7 +19,7 @@ pytestmark = pytest.mark.asyncio
 @fixturecheck()
 async def async_fixture():
     """An async fixture that returns a string after an await."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return "async result"
 
 
@@ -32,7 +27,7 @@ async def async_fixture():
 @fixturecheck()
 async def async_fixture_order2():
     """An async fixture with different decorator order."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return "another async result"
 
 
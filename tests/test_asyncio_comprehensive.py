@@ -75,7 +75,7 @@ async def test_async_fixture_with_validator():
     @fixturecheck(safe_validator)
     @pytest.fixture
     async def async_fixture():
-        await asyncio.sleep(0.01)  # Simulate async operation
+        await asyncio.sleep(0)  # Simulate async operation
         return "async fixture value"
 
     # Create mock request
@@ -150,7 +150,7 @@ async def test_async_fixture_validation_result():
 
     # Define a test async function
     async def async_test_func():
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return {"value": "async"}
 
     # Call the function to get a coroutine
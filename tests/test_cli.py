@@ -1,5 +1,7 @@
 """Tests for the fixturecheck CLI functionality."""
 
+import shutil
+
 import pytest
 from click.testing import CliRunner
 
@@ -7,11 +9,23 @@ from pytest_fixturecheck.cli import fixturecheck
 from pytest_fixturecheck.plugin import FixtureCheckPlugin
 
 
-@pytest.fixture
-def test_dir(tmp_path):
-    """Create a temporary directory with test files."""
+@pytest.fixture(scope="session")
+def runner():
+    """A CliRunner shared by every CLI test; it keeps no state between invokes."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def test_dir_template(tmp_path_factory):
+    """Create a directory with test files, once per session.
+
+    Tests that only read the tree use this directly; tests that modify it use
+    ``test_dir`` for a private copy.
+    """
+    template = tmp_path_factory.mktemp("cli_template")
+
     # Create a test file with fixtures
-    test_file = tmp_path / "test_example.py"
+    test_file = template / "test_example.py"
     test_file.write_text("""
 import pytest
 from pytest_fixturecheck import fixturecheck
@@ -33,7 +47,7 @@ def async_fixture():
 """)
 
     # Create a conftest.py with fixtures
-    conftest = tmp_path / "conftest.py"
+    conftest = template / "conftest.py"
     conftest.write_text("""
 import pytest
 from pytest_fixturecheck import fixturecheck
@@ -48,23 +62,67 @@ def shared_checked_fixture():
     return "shared_checked"
 """)
 
+    return template
+
+
+@pytest.fixture
+def test_dir(test_dir_template, tmp_path):
+    """Create a private copy of the test files for tests that modify them."""
+    shutil.copytree(test_dir_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
-def test_report_command(test_dir):
+def test_report_command(test_dir_template, runner):
     """Test the report command."""
-    runner = CliRunner()
-    result = runner.invoke(fixturecheck, ["report", "--path", str(test_dir)])
+    result = runner.invoke(fixturecheck, ["report", "--path", str(test_dir_template)])
 
     assert result.exit_code == 0
     assert "Found 3 opportunities for fixture checks" in result.output
     assert "Found 2 existing fixture checks" in result.output
 
 
-def test_add_command_dry_run(test_dir):
+def test_analyze(test_dir_template):
+    """Test that analyze totals the per-file counts and keeps each file's content."""
+    analysis = FixtureCheckPlugin().analyze(str(test_dir_template))
+
+    assert analysis["opportunities"] == 3
+    assert analysis["existing"] == 2
+
+    files = {entry["path"].name: entry for entry in analysis["files"]}
+    assert sorted(files) == ["conftest.py", "test_example.py"]
+    assert files["test_example.py"]["opportunities"] == 2
+    assert files["test_example.py"]["existing"] == 1
+    assert files["conftest.py"]["opportunities"] == 1
+    assert files["conftest.py"]["existing"] == 1
+    for entry in files.values():
+        assert entry["content"] == entry["path"].read_text()
+        # Details are only built on request
+        assert "opportunity_details" not in entry
+        assert "existing_details" not in entry
+
+
+def test_analyze_with_details(test_dir_template):
+    """Test that analyze(details=True) adds each file's fixture details."""
+    analysis = FixtureCheckPlugin().analyze(str(test_dir_template), details=True)
+
+    files = {entry["path"].name: entry for entry in analysis["files"]}
+    assert [d["name"] for d in files["test_example.py"]["opportunity_details"]] == [
+        "simple_fixture",
+        "async_fixture",
+    ]
+    assert [d["name"] for d in files["test_example.py"]["existing_details"]] == ["checked_fixture"]
+    assert [d["name"] for d in files["conftest.py"]["opportunity_details"]] == ["shared_fixture"]
+    assert [d["name"] for d in files["conftest.py"]["existing_details"]] == [
+        "shared_checked_fixture"
+    ]
+    assert files["conftest.py"]["existing_details"][0]["filename"] == str(
+        test_dir_template / "conftest.py"
+    )
+
+
+def test_add_command_dry_run(test_dir_template, runner):
     """Test the add command in dry-run mode."""
-    runner = CliRunner()
-    result = runner.invoke(fixturecheck, ["add", "--path", str(test_dir), "--dry-run"])
+    result = runner.invoke(fixturecheck, ["add", "--path", str(test_dir_template), "--dry-run"])
 
     assert result.exit_code == 0
     assert "Would modify" in result.output
@@ -72,9 +130,26 @@ def test_add_command_dry_run(test_dir):
     assert "conftest.py" in result.output
 
 
-def test_add_command(test_dir):
+def test_report_and_add_skip_details_when_not_shown(test_dir, runner, monkeypatch):
+    """Test that report without -v and add only count fixtures, never building details."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("details should not be built")
+
+    monkeypatch.setattr(FixtureCheckPlugin, "get_opportunities_details", fail)
+    monkeypatch.setattr(FixtureCheckPlugin, "get_existing_checks_details", fail)
+
+    result = runner.invoke(fixturecheck, ["report", "--path", str(test_dir)])
+    assert result.exit_code == 0
+    assert "Found 3 opportunities for fixture checks" in result.output
+
+    result = runner.invoke(fixturecheck, ["add", "--path", str(test_dir)])
+    assert result.exit_code == 0
+    assert (test_dir / "conftest.py").read_text().count("@fixturecheck()") == 2
+
+
+def test_add_command(test_dir, runner):
     """Test the add command."""
-    runner = CliRunner()
     result = runner.invoke(fixturecheck, ["add", "--path", str(test_dir)])
 
     assert result.exit_code == 0
@@ -119,6 +194,35 @@ def fixture3():
     assert plugin.count_opportunities(content) == 2  # fixture1 and fixture3
 
 
+def test_plugin_queries_share_one_parse(monkeypatch):
+    """Test that the plugin's queries over the same content parse it only once."""
+    import ast
+
+    plugin = FixtureCheckPlugin()
+    parses = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda source: parses.append(source) or real_parse(source))
+
+    content = """
+import pytest
+
+@pytest.fixture
+def shared_parse_fixture():
+    return 1
+
+@pytest.fixture
+@fixturecheck()
+def shared_parse_checked_fixture():
+    return 2
+"""
+    assert plugin.count_opportunities(content) == 1
+    assert plugin.count_existing_checks(content) == 1
+    assert len(plugin.get_opportunities_details(content, "test_file.py")) == 1
+    assert len(plugin.get_existing_checks_details(content, "test_file.py")) == 1
+    assert "@fixturecheck()\ndef shared_parse_fixture" in plugin.add_fixture_checks(content)
+    assert parses == [content]
+
+
 def test_plugin_count_existing_checks():
     """Test the plugin's existing check counting."""
     plugin = FixtureCheckPlugin()
@@ -143,6 +247,163 @@ def fixture3():
     assert plugin.count_existing_checks(content) == 2  # fixture2 and fixture3
 
 
+def test_plugin_counts_bare_and_attribute_fixturecheck():
+    """Bare and attribute-style fixturecheck decorators count as existing checks."""
+    plugin = FixtureCheckPlugin()
+
+    content = """
+import pytest
+import pytest_fixturecheck
+
+@pytest.fixture
+@fixturecheck
+def fixture1():
+    return 1
+
+@pytest.fixture
+@pytest_fixturecheck.fixturecheck(validator)
+def fixture2():
+    return 2
+"""
+    assert plugin.count_existing_checks(content) == 2
+    assert plugin.count_opportunities(content) == 0
+    assert plugin.add_fixture_checks(content) == content
+
+    details = plugin.get_existing_checks_details(content, "test_file.py")
+    assert [d["validator"] for d in details] == ["Default validator", "validator"]
+
+
+@pytest.mark.parametrize(
+    "validator_source",
+    [
+        "my_validator",
+        "validators.is_instance_of",
+        "pkg.validators.is_instance_of(User)",
+        "has_required_fields('name', 'email')",
+        "check_property_values(strict=False, count=3, ratio=0.5, owner=None)",
+        "nested(lambda x: x)",
+        "has_required_fields(*FIELDS)",
+        'check_property_values(name="it\'s \\"quoted\\"")',
+        "factory()(arg)",
+    ],
+)
+def test_extract_validator_info_matches_unparse(validator_source):
+    """The fast path for simple validators renders the same text as ast.unparse."""
+    import ast
+
+    if not hasattr(ast, "unparse"):
+        pytest.skip("ast.unparse requires Python 3.9+")
+
+    plugin = FixtureCheckPlugin()
+    decorator = ast.parse(f"fixturecheck({validator_source})", mode="eval").body
+    expected = ast.unparse(decorator.args[0])
+    assert plugin._extract_validator_info(decorator) == expected
+
+
+def test_plugin_scans_module_and_class_scope_only():
+    """Fixtures are found at module and (nested) class scope, not inside functions."""
+    plugin = FixtureCheckPlugin()
+
+    content = """
+import pytest
+
+@pytest.fixture
+def module_fixture():
+    return 1
+
+class TestOuter:
+    @pytest.fixture
+    def class_fixture(self):
+        return 2
+
+    class TestInner:
+        @pytest.fixture
+        def nested_class_fixture(self):
+            return 3
+
+def helper():
+    @pytest.fixture
+    def local_fixture():
+        return 4
+"""
+    details = plugin.get_opportunities_details(content, "test_file.py")
+    assert [d["name"] for d in details] == [
+        "module_fixture",
+        "class_fixture",
+        "nested_class_fixture",
+    ]
+
+
+def test_plugin_scans_conditional_blocks():
+    """Fixtures under module or class level if/try/with blocks are found."""
+    plugin = FixtureCheckPlugin()
+
+    content = """
+import pytest
+
+if HAS_DJANGO:
+    @pytest.fixture
+    def django_fixture():
+        return 1
+else:
+    @pytest.fixture
+    def fallback_fixture():
+        return 2
+
+try:
+    import extra
+except ImportError:
+    @pytest.fixture
+    def missing_extra_fixture():
+        return 3
+finally:
+    @pytest.fixture
+    @fixturecheck()
+    def finally_fixture():
+        return 4
+
+class TestGuarded:
+    with warnings.catch_warnings():
+        @pytest.fixture
+        def guarded_fixture(self):
+            return 5
+"""
+    details = plugin.get_opportunities_details(content, "test_file.py")
+    assert [d["name"] for d in details] == [
+        "django_fixture",
+        "fallback_fixture",
+        "missing_extra_fixture",
+        "guarded_fixture",
+    ]
+    assert plugin.count_existing_checks(content) == 1
+
+    modified = plugin.add_fixture_checks(content)
+    assert modified.count("@fixturecheck()") == 5
+    assert "    @pytest.fixture\n    @fixturecheck()\n    def django_fixture" in modified
+    compile(modified, "<test>", "exec")
+
+
+def test_plugin_add_fixture_checks_preserves_layout():
+    """Inserted decorators follow the fixture's indentation and line endings."""
+    plugin = FixtureCheckPlugin()
+
+    content = (
+        "import pytest\r\n"
+        "\r\n"
+        "class TestThing:\r\n"
+        "    @pytest.fixture(\r\n"
+        '        scope="class",\r\n'
+        "    )\r\n"
+        "    def thing(self):\r\n"
+        "        return 1\r\n"
+    )
+    modified = plugin.add_fixture_checks(content)
+
+    assert modified == content.replace("    )\r\n", "    )\r\n    @fixturecheck()\r\n")
+    # The result must still be valid Python
+    compile(modified, "<test>", "exec")
+
+
 def test_plugin_add_fixture_checks():
     """Test the plugin's fixture check addition."""
     plugin = FixtureCheckPlugin()
@@ -174,28 +435,47 @@ def fixture3():
 # === NEW EDGE CASE TESTS ===
 
 
-def test_report_command_nonexistent_path():
-    """Test report command with non-existent path."""
-    runner = CliRunner()
-    result = runner.invoke(fixturecheck, ["report", "--path", "/nonexistent/path"])
+def test_analyze_many_files_keeps_file_order(tmp_path):
+    """Test that analyze returns one entry per file, in find_test_files order."""
+    from pytest_fixturecheck.utils import find_test_files
+
+    for i in range(8):
+        (tmp_path / f"test_many_{i}.py").write_text(f"""
+import pytest
+
+@pytest.fixture
+def fixture_{i}():
+    return {i}
+""")
+
+    analysis = FixtureCheckPlugin().analyze(str(tmp_path), details=True)
+
+    assert [entry["path"] for entry in analysis["files"]] == find_test_files(tmp_path)
+    for entry in analysis["files"]:
+        assert [d["name"] for d in entry["opportunity_details"]] == [
+            "fixture_" + entry["path"].stem.rsplit("_", 1)[1]
+        ]
+    assert analysis["opportunities"] == 8
+
+
+def test_analyze_nonexistent_path():
+    """Test analyze with non-existent path."""
+    analysis = FixtureCheckPlugin().analyze("/nonexistent/path")
 
     # Should handle gracefully by finding no files
-    assert result.exit_code == 0
-    assert "Found 0 opportunities for fixture checks" in result.output
-    assert "Found 0 existing fixture checks" in result.output
+    assert analysis == {"opportunities": 0, "existing": 0, "files": []}
 
 
-def test_add_command_nonexistent_path():
+def test_add_command_nonexistent_path(runner):
     """Test add command with non-existent path."""
-    runner = CliRunner()
     result = runner.invoke(fixturecheck, ["add", "--path", "/nonexistent/path"])
 
     # Should handle gracefully by finding no files to modify
     assert result.exit_code == 0
 
 
-def test_report_command_custom_pattern(test_dir):
-    """Test report command with custom file pattern."""
+def test_analyze_custom_pattern(test_dir):
+    """Test analyze with custom file pattern."""
     # Create a file that matches custom pattern
     custom_file = test_dir / "my_test.py"
     custom_file.write_text("""
@@ -206,17 +486,18 @@ def custom_fixture():
     return "custom"
 """)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        fixturecheck, ["report", "--path", str(test_dir), "--pattern", "my_*.py"]
-    )
+    analysis = FixtureCheckPlugin().analyze(str(test_dir), "my_*.py")
 
-    assert result.exit_code == 0
-    # The pattern search might find files in test_dir, so be more flexible
-    assert "opportunities for fixture checks" in result.output
+    # conftest.py is always included alongside the files matching the pattern
+    assert sorted(entry["path"].name for entry in analysis["files"]) == [
+        "conftest.py",
+        "my_test.py",
+    ]
+    assert analysis["opportunities"] == 2  # custom_fixture and shared_fixture
+    assert analysis["existing"] == 1  # shared_checked_fixture
 
 
-def test_add_command_custom_pattern(test_dir):
+def test_add_command_custom_pattern(test_dir, runner):
     """Test add command with custom file pattern."""
     # Create a file that matches custom pattern
     custom_file = test_dir / "my_test.py"
@@ -228,7 +509,6 @@ def custom_fixture():
     return "custom"
 """)
 
-    runner = CliRunner()
     result = runner.invoke(fixturecheck, ["add", "--path", str(test_dir), "--pattern", "my_*.py"])
 
     assert result.exit_code == 0
@@ -239,19 +519,15 @@ def custom_fixture():
     assert "@fixturecheck()" in content
 
 
-def test_report_command_empty_directory(tmp_path):
-    """Test report command with empty directory."""
-    runner = CliRunner()
-    result = runner.invoke(fixturecheck, ["report", "--path", str(tmp_path)])
+def test_analyze_empty_directory(tmp_path):
+    """Test analyze with empty directory."""
+    analysis = FixtureCheckPlugin().analyze(str(tmp_path))
 
-    assert result.exit_code == 0
-    assert "Found 0 opportunities for fixture checks" in result.output
-    assert "Found 0 existing fixture checks" in result.output
+    assert analysis == {"opportunities": 0, "existing": 0, "files": []}
 
 
-def test_add_command_empty_directory(tmp_path):
+def test_add_command_empty_directory(tmp_path, runner):
     """Test add command with empty directory."""
-    runner = CliRunner()
     result = runner.invoke(fixturecheck, ["add", "--path", str(tmp_path)])
 
     assert result.exit_code == 0
@@ -353,7 +629,7 @@ def param_fixture(param):
     assert modified.count("@fixturecheck()") == 3  # All fixtures should have it
 
 
-def test_add_command_no_modifications_needed(test_dir):
+def test_add_command_no_modifications_needed(test_dir, runner):
     """Test add command when no modifications are needed."""
     # Create a file where all fixtures already have checks
     perfect_file = test_dir / "test_perfect.py"
@@ -367,7 +643,6 @@ def perfect_fixture():
     return "perfect"
 """)
 
-    runner = CliRunner()
     result = runner.invoke(
         fixturecheck, ["add", "--path", str(test_dir), "--pattern", "test_perfect.py"]
     )
@@ -377,10 +652,8 @@ def perfect_fixture():
     # The pattern might match other files in the directory
 
 
-def test_cli_help_commands():
+def test_cli_help_commands(runner):
     """Test CLI help functionality."""
-    runner = CliRunner()
-
     # Test main help
     result = runner.invoke(fixturecheck, ["--help"])
     assert result.exit_code == 0
@@ -436,8 +709,6 @@ def scoped_fixture():
 
 def test_exclusion_patterns(tmp_path):
     """Test that virtual environments and package directories are excluded."""
-    runner = CliRunner()
-
     # Create various directories that should be excluded
     excluded_dirs = [
         ".venv",
@@ -479,19 +750,16 @@ def legitimate_fixture():
     return "should_be_found"
 """)
 
-    # Run report command
-    result = runner.invoke(fixturecheck, ["report", "--path", str(tmp_path)])
+    analysis = FixtureCheckPlugin().analyze(str(tmp_path))
 
-    assert result.exit_code == 0
     # Should only find the legitimate fixture, not the excluded ones
-    assert "Found 1 opportunities for fixture checks" in result.output
-    assert "Found 0 existing fixture checks" in result.output
+    assert [entry["path"] for entry in analysis["files"]] == [legitimate_test]
+    assert analysis["opportunities"] == 1
+    assert analysis["existing"] == 0
 
 
-def test_exclusion_with_verbose(tmp_path):
+def test_exclusion_with_verbose(tmp_path, runner):
     """Test exclusion with verbose output."""
-    runner = CliRunner()
-
     # Create .venv directory with test file
     venv_dir = tmp_path / ".venv" / "lib" / "python3.13" / "site-packages" / "somepackage"
     venv_dir.mkdir(parents=True)
@@ -525,10 +793,8 @@ def real_fixture():
     assert ".venv" not in result.output
 
 
-def test_exclusion_conftest_in_venv(tmp_path):
+def test_exclusion_conftest_in_venv(tmp_path, runner):
     """Test that conftest.py files in virtual environments are also excluded."""
-    runner = CliRunner()
-
     # Create conftest.py in .venv (should be excluded)
     venv_dir = tmp_path / ".venv" / "lib" / "python3.13" / "site-packages"
     venv_dir.mkdir(parents=True)
@@ -33,6 +33,15 @@ def test_property_values_validator():
         validator(ValTestObject(name="wrong"), False)
 
 
+def test_property_values_validator_snapshots_expected_values():
+    """Changing the dictionary after building the validator doesn't affect it."""
+    expected = {"name": "test"}
+    validator = property_values_validator(expected)
+    expected["name"] = "changed"
+
+    validator(ValTestObject(name="test"), False)
+
+
 # First define with pytest.fixture, then apply fixturecheck with our validator
 @pytest.fixture
 @fixturecheck(property_values_validator({"name": "fixture_test"}))
@@ -1,5 +1,6 @@
 """Tests for the pytest-fixturecheck plugin."""
 
+import sys
 import unittest.mock as mock  # Import with an alias for unittest.mock
 from unittest.mock import MagicMock, patch
 
@@ -139,6 +140,30 @@ class TestIsAsyncFixture:
         mock_fixturedef._pytest_asyncio_scope = "function"
         assert not is_async_fixture(mock_fixturedef)
 
+    def test_pytest_asyncio_detection_is_lazy(self):
+        """pytest-asyncio availability is resolved on first use and then remembered."""
+        from pytest_fixturecheck import plugin
+
+        with patch.object(plugin, "PYTEST_ASYNCIO_INSTALLED", None), patch.dict(
+            "sys.modules", {"pytest_asyncio": None}
+        ):
+            assert plugin._pytest_asyncio_installed() is False
+            assert plugin.PYTEST_ASYNCIO_INSTALLED is False
+
+        with patch.object(plugin, "PYTEST_ASYNCIO_INSTALLED", True), patch.dict(
+            "sys.modules", {"pytest_asyncio": None}
+        ):
+            assert plugin._pytest_asyncio_installed() is True
+
+        # Found on the path without importing it
+        with patch.object(plugin, "PYTEST_ASYNCIO_INSTALLED", None), patch.object(
+            plugin, "find_spec", return_value=object()
+        ) as mock_find_spec, patch.dict("sys.modules"):
+            sys.modules.pop("pytest_asyncio", None)
+            assert plugin._pytest_asyncio_installed() is True
+            mock_find_spec.assert_called_once_with("pytest_asyncio")
+            assert "pytest_asyncio" not in sys.modules
+
     # This is the correct and final version of this test
     @patch("pytest_fixturecheck.plugin.PYTEST_ASYNCIO_INSTALLED", True)
     @patch("builtins.hasattr", autospec=True)
@@ -1209,9 +1234,10 @@ class TestPytestCollectionFinish:
         with patch("pytest_fixturecheck.plugin.is_async_fixture", return_value=False):
             pytest_collection_finish(mock_session)
 
-        fdef.execute.assert_called_once()
+        # Nothing can be reported without a validator, so the fixture is not executed
+        mock_session._fixturemanager.getfixturerequest.assert_not_called()
+        fdef.execute.assert_not_called()
         validator_assertion_obj.assert_not_called()
-        # Plugin doesn't report "expected error but none occurred" if validator is None for exec phase
         mock_rep_err.assert_not_called()
         mock_py_exit.assert_not_called()
 
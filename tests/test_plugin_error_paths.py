@@ -1,5 +1,7 @@
 """Tests for plugin error paths and edge cases to improve coverage."""
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -25,12 +27,19 @@ class TestPluginErrorPaths:
         pytest_addoption(mock_parser)
 
         # Verify addini was called with correct parameters
-        mock_parser.addini.assert_called_once_with(
+        assert mock_parser.addini.call_count == 2
+        mock_parser.addini.assert_any_call(
             "fixturecheck-auto-skip",
             help="Automatically skip tests with invalid fixtures instead of failing",
             default="false",
             type="bool",
         )
+        mock_parser.addini.assert_any_call(
+            "fixturecheck-parallel",
+            help="Run @fixturecheck validators on fixture results concurrently in a thread pool",
+            default="false",
+            type="bool",
+        )
 
     def test_pytest_configure_coverage(self):
         """Test pytest_configure function for coverage."""
@@ -41,6 +50,37 @@ class TestPluginErrorPaths:
         mock_config.addinivalue_line.assert_called_once_with(
             "markers", "fixturecheck: mark a test as using fixture validation"
         )
+        # The fixture registry starts out empty
+        assert mock_config._fixturecheck_fixtures == set()
+
+    @pytest.mark.parametrize("ini_value, expected", [(True, True), (False, False), ("true", True)])
+    def test_pytest_configure_caches_auto_skip(self, ini_value, expected):
+        """The bool ini option is parsed once and honoured by collection."""
+        mock_config = Mock()
+        mock_config.getini = Mock(return_value=ini_value)
+        pytest_configure(mock_config)
+        assert mock_config._fixturecheck_auto_skip is expected
+
+        def failing_validator(obj, is_collection_phase):
+            raise ValueError("bad fixture")
+
+        mock_fixturedef = Mock()
+        mock_fixturedef.argname = "bad"
+        mock_fixturedef.func._validator = failing_validator
+        mock_fixturedef.func._expect_validation_error = False
+        mock_config._fixturecheck_fixtures.add(mock_fixturedef)
+        mock_config.getini.reset_mock()
+
+        mock_session = Mock()
+        mock_session.config = mock_config
+        mock_session.items = []
+
+        with patch("pytest_fixturecheck.plugin.report_fixture_errors"):
+            with patch("pytest_fixturecheck.plugin.pytest.exit") as mock_exit:
+                pytest_collection_finish(mock_session)
+
+        mock_config.getini.assert_not_called()
+        assert mock_exit.called is not expected
 
     def test_is_async_fixture_with_unittest_async(self):
         """Test is_async_fixture with unittest async fixture."""
@@ -71,6 +111,53 @@ class TestPluginErrorPaths:
         # Should detect async via pytest-asyncio attribute
         assert is_async_fixture(mock_fixturedef) == True
 
+    def test_is_async_fixture_caches_result_on_fixturedef(self):
+        """is_async_fixture only inspects a fixturedef once."""
+
+        class PlainFixtureDef:
+            argname = "async_cached_fixture"
+
+            def func(self):
+                pass
+
+        fixturedef = PlainFixtureDef()
+        assert is_async_fixture(fixturedef) is True
+        assert fixturedef._fixturecheck_is_async is True
+
+        # Later changes are not re-inspected
+        fixturedef.argname = "plain_fixture"
+        assert is_async_fixture(fixturedef) is True
+
+    def test_is_async_fixture_detected_once_across_hooks(self):
+        """Async detection done at fixture setup is reused during collection."""
+        from pytest_fixturecheck import fixturecheck
+
+        @fixturecheck()
+        def sync_fixture():
+            return 1
+
+        class PlainFixtureDef:
+            argname = "sync_fixture"
+
+            def execute(self, request):
+                return 1
+
+        fixturedef = PlainFixtureDef()
+        fixturedef.func = sync_fixture
+        mock_request = Mock()
+        mock_request.config._fixturecheck_fixtures = set()
+        mock_session = Mock()
+        mock_session.config = mock_request.config
+        mock_session.config.getini = Mock(return_value="false")
+
+        with patch(
+            "pytest_fixturecheck.plugin._detect_async_fixture", return_value=False
+        ) as mock_detect:
+            pytest_fixture_setup(fixturedef, mock_request)
+            pytest_collection_finish(mock_session)
+
+        mock_detect.assert_called_once_with(fixturedef)
+
     def test_pytest_fixture_setup_with_wrapped_function(self):
         """Test pytest_fixture_setup with wrapped function."""
         mock_fixturedef = Mock()
@@ -97,6 +184,118 @@ class TestPluginErrorPaths:
         # Should detect the fixturecheck marker on the inner function
         assert hasattr(mock_request.config, "_fixturecheck_fixtures")
 
+    def test_find_marked_func_walks_real_wrapper_chain(self):
+        """The marked function is found through functools.wraps wrappers."""
+        import functools
+
+        from pytest_fixturecheck.plugin import _find_marked_func
+
+        def inner():
+            return 1
+
+        inner._fixturecheck = True
+
+        @functools.wraps(inner)
+        def middle():
+            return inner()
+
+        middle._fixturecheck = False
+
+        @functools.wraps(middle)
+        def outer():
+            return middle()
+
+        outer._fixturecheck = False
+
+        assert _find_marked_func(outer) is inner
+
+        # Nothing marked: fall back to the function we started from
+        inner._fixturecheck = False
+        assert _find_marked_func(outer) is outer
+
+        # A cyclic chain is not followed forever
+        inner.__wrapped__ = outer
+        assert _find_marked_func(outer) is outer
+
+    def test_resolve_fixturecheck_caches_on_fixturedef(self):
+        """The wrapper chain is walked once per fixturedef function."""
+        from pytest_fixturecheck.plugin import _resolve_fixturecheck
+
+        def validator(obj, is_collection_phase):
+            pass
+
+        def fixture_func():
+            pass
+
+        fixture_func._fixturecheck = True
+        fixture_func._validator = validator
+        fixture_func._expect_validation_error = True
+
+        class PlainFixtureDef:
+            pass
+
+        fixturedef = PlainFixtureDef()
+        fixturedef.func = fixture_func
+        with patch(
+            "pytest_fixturecheck.plugin._find_marked_func", side_effect=lambda func: func
+        ) as mock_find:
+            assert _resolve_fixturecheck(fixturedef) == (fixture_func, validator, True)
+            assert _resolve_fixturecheck(fixturedef) == (fixture_func, validator, True)
+            assert mock_find.call_count == 1
+
+            # A different function is resolved afresh
+            fixturedef.func = validator
+            assert _resolve_fixturecheck(fixturedef) == (validator, None, False)
+            assert mock_find.call_count == 2
+
+    def test_resolve_fixturecheck_needs_no_chain_walk_under_wraps(self):
+        """Decorators applied over @fixturecheck carry its resolved attributes."""
+        import functools
+
+        from pytest_fixturecheck import fixturecheck
+        from pytest_fixturecheck.plugin import _resolve_fixturecheck
+
+        def validator(obj, is_collection_phase):
+            pass
+
+        def outer_decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @outer_decorator
+        @fixturecheck(validator, expect_validation_error=True)
+        def decorated():
+            return 1
+
+        fixturedef = Mock()
+        fixturedef.func = decorated
+        # functools.wraps copies __dict__, so the validator is found on the
+        # outermost function without unwrapping
+        with patch("pytest_fixturecheck.plugin.inspect.unwrap") as mock_unwrap:
+            assert _resolve_fixturecheck(fixturedef) == (decorated, validator, True)
+        mock_unwrap.assert_not_called()
+
+    def test_pytest_fixture_setup_fast_path_before_any_fixturecheck(self):
+        """The hook does nothing until @fixturecheck has wrapped a fixture."""
+        from pytest_fixturecheck import fixturecheck, plugin
+
+        mock_fixturedef = Mock()
+        mock_request = Mock(spec=["config"])
+        mock_request.config = Mock(spec=[])
+
+        with patch.object(plugin, "_fixturecheck_registered", False):
+            pytest_fixture_setup(mock_fixturedef, mock_request)
+            assert not hasattr(mock_request.config, "_fixturecheck_fixtures")
+
+            @fixturecheck()
+            def my_fixture():
+                return 1
+
+            assert plugin._fixturecheck_registered is True
+
     def test_pytest_fixture_setup_async_fixture_skip(self):
         """Test pytest_fixture_setup with async fixture gets skip marker."""
         mock_fixturedef = Mock()
@@ -193,6 +392,190 @@ class TestPluginErrorPaths:
                     # Should not exit
                     mock_exit.assert_not_called()
 
+    def test_pytest_collection_finish_expected_error_skips_traceback(self):
+        """Expected validation errors are not formatted into tracebacks."""
+        mock_session = Mock()
+        mock_session.config.getini = Mock(return_value="false")
+
+        def failing_validator(obj, is_collection_phase):
+            raise ValueError("expected")
+
+        mock_fixturedef = Mock()
+        mock_fixturedef.func._validator = failing_validator
+        mock_fixturedef.func._expect_validation_error = True
+        mock_session.config._fixturecheck_fixtures = {mock_fixturedef}
+
+        with patch("pytest_fixturecheck.plugin.traceback.format_exc") as mock_format_exc:
+            with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                pytest_collection_finish(mock_session)
+
+        mock_format_exc.assert_not_called()
+        mock_report.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error, is_async_error",
+        [
+            (RuntimeError("asyncio.run() cannot be called from a running loop"), True),
+            (RuntimeError("There is no current event loop in thread 'MainThread'."), True),
+            (RuntimeError("coroutine was never awaited"), True),
+            (TypeError("object is not Awaitable"), True),
+            (asyncio.InvalidStateError("Result is not set."), False),
+            (asyncio.QueueEmpty(), False),
+            (RuntimeError("no running event loop"), True),
+            (RuntimeError("database is unavailable"), False),
+            (RuntimeError("Event loop is closed"), False),
+            (RuntimeError("This event loop is already running"), False),
+        ],
+    )
+    def test_pytest_collection_finish_async_execute_errors(self, error, is_async_error):
+        """Async-looking execution errors mark the fixture skipped instead of failing."""
+        mock_session = Mock()
+        mock_session.config.getini = Mock(return_value="false")
+
+        mock_fixturedef = Mock(spec=["func", "argname", "execute"])
+        mock_fixturedef.func = Mock()
+        mock_fixturedef.func._validator = None
+        mock_fixturedef.func._expect_validation_error = False
+        mock_fixturedef.argname = "plain_fixture"
+        mock_fixturedef.execute = Mock(side_effect=error)
+        mock_fixturedef._fixturecheck_skip = False
+        mock_session.config._fixturecheck_fixtures = {mock_fixturedef}
+
+        with patch("pytest_fixturecheck.plugin.is_async_fixture", return_value=False):
+            with patch("pytest_fixturecheck.plugin.pytest.exit"):
+                with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                    pytest_collection_finish(mock_session)
+
+        assert mock_fixturedef._fixturecheck_skip is is_async_error
+        assert mock_report.called is not is_async_error
+
+    def test_pytest_collection_finish_does_not_reuse_previous_expect_flag(self):
+        """A broken fixturedef is reported even after a fixture that expected an error."""
+
+        class BrokenFixtureDef:
+            argname = "broken"
+
+            @property
+            def func(self):
+                raise RuntimeError("cannot read func")
+
+        def failing_validator(obj, is_collection_phase):
+            raise ValueError("expected")
+
+        expecting = Mock()
+        expecting.func._validator = failing_validator
+        expecting.func._expect_validation_error = True
+        broken = BrokenFixtureDef()
+
+        mock_session = Mock()
+        mock_session.config.getini = Mock(return_value="false")
+        # Ordered so the broken fixturedef is validated second
+        mock_session.config._fixturecheck_fixtures = [expecting, broken]
+
+        with patch("pytest_fixturecheck.plugin.pytest.exit"):
+            with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                pytest_collection_finish(mock_session)
+
+        reported = mock_report.call_args[0][0]
+        assert [fixturedef for fixturedef, _, _ in reported] == [broken]
+
+    def test_pytest_collection_finish_self_validating_fixture(self):
+        """Fixtures that validate their own result aren't validated again after execute."""
+        validator = Mock()
+
+        def fixture():
+            return "value"
+
+        fixture._fixturecheck = True
+        fixture._validator = validator
+        fixture._expect_validation_error = False
+        fixture._validates_result = True
+
+        fixturedef = Mock()
+        fixturedef.func = fixture
+        fixturedef.execute.return_value = "value"
+        fixturedef._fixturecheck_skip = False
+        del fixturedef.unittest
+
+        mock_session = Mock()
+        mock_session.config.getini = Mock(return_value="false")
+        mock_session.config._fixturecheck_fixtures = [fixturedef]
+
+        with patch("pytest_fixturecheck.plugin.is_async_fixture", return_value=False):
+            with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                pytest_collection_finish(mock_session)
+
+        fixturedef.execute.assert_called_once()
+        # Only the collection-phase call on the function itself
+        validator.assert_called_once_with(fixture, True)
+        assert not mock_report.called
+
+    @staticmethod
+    def _result_failing_fixturedefs(names, execute):
+        """Fixturedefs that execute via *execute* and fail validation on their result."""
+
+        def failing_validator(obj, is_collection_phase):
+            if not is_collection_phase:
+                raise ValueError(f"bad {obj}")
+
+        fixturedefs = []
+        for name in names:
+            fixturedef = Mock(spec=["func", "argname", "execute"])
+            fixturedef.argname = name
+            fixturedef.func = Mock()
+            fixturedef.func._validator = failing_validator
+            fixturedef.func._expect_validation_error = False
+            fixturedef.func._validates_result = False
+            fixturedef.execute = Mock(side_effect=lambda request, name=name: execute(name))
+            fixturedef._fixturecheck_skip = False
+            fixturedefs.append(fixturedef)
+        return fixturedefs
+
+    @pytest.mark.parametrize("parallel", [True, "true", False, "false"])
+    def test_pytest_collection_finish_parallel_reports_same_failures(self, parallel):
+        """fixturecheck-parallel only changes how fixtures are validated, not the outcome."""
+        fixturedefs = self._result_failing_fixturedefs(["first", "second", "third"], str)
+
+        ini = {"fixturecheck-auto-skip": False, "fixturecheck-parallel": parallel}
+        mock_session = Mock()
+        mock_session.config.getini = Mock(side_effect=ini.__getitem__)
+        mock_session.config._fixturecheck_fixtures = fixturedefs
+
+        with patch("pytest_fixturecheck.plugin.is_async_fixture", return_value=False):
+            with patch("pytest_fixturecheck.plugin.ThreadPoolExecutor") as mock_executor:
+                mock_executor.return_value.__enter__.return_value.map = map
+                with patch("pytest_fixturecheck.plugin.pytest.exit"):
+                    with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                        pytest_collection_finish(mock_session)
+
+        assert mock_executor.called is (parallel in (True, "true"))
+        reported = mock_report.call_args[0][0]
+        assert [str(error) for _, error, _ in reported] == ["bad first", "bad second", "bad third"]
+
+    def test_pytest_collection_finish_parallel_executes_on_main_thread(self):
+        """With fixturecheck-parallel, fixtures still execute serially on the calling thread."""
+        execute_threads = []
+
+        def execute(name):
+            execute_threads.append(threading.current_thread())
+            return name
+
+        fixturedefs = self._result_failing_fixturedefs(["first", "second", "third"], execute)
+
+        ini = {"fixturecheck-auto-skip": False, "fixturecheck-parallel": True}
+        mock_session = Mock()
+        mock_session.config.getini = Mock(side_effect=ini.__getitem__)
+        mock_session.config._fixturecheck_fixtures = fixturedefs
+
+        with patch("pytest_fixturecheck.plugin.is_async_fixture", return_value=False):
+            with patch("pytest_fixturecheck.plugin.pytest.exit"):
+                with patch("pytest_fixturecheck.plugin.report_fixture_errors") as mock_report:
+                    pytest_collection_finish(mock_session)
+
+        assert execute_threads == [threading.current_thread()] * 3
+        reported = mock_report.call_args[0][0]
+        assert [str(error) for _, error, _ in reported] == ["bad first", "bad second", "bad third"]
+
     def test_mark_dependent_tests_for_skip(self):
         """Test _mark_dependent_tests_for_skip function."""
         mock_session = Mock()
@@ -217,6 +600,99 @@ class TestPluginErrorPaths:
         mock_item1.add_marker.assert_called_once()
         mock_item2.add_marker.assert_not_called()
 
+    def test_mark_dependent_tests_for_skip_with_prebuilt_index(self):
+        """A prebuilt fixture index is used instead of rescanning session.items."""
+        from pytest_fixturecheck.plugin import _index_items_by_fixture
+
+        mock_item1 = Mock()
+        mock_item1.fixturenames = ["first_fixture", "other_fixture"]
+        mock_item2 = Mock()
+        mock_item2.fixturenames = ["second_fixture"]
+
+        fixture_to_items = _index_items_by_fixture([mock_item1, mock_item2])
+        assert fixture_to_items == {
+            "first_fixture": [mock_item1],
+            "other_fixture": [mock_item1],
+            "second_fixture": [mock_item2],
+        }
+
+        mock_session = Mock()
+        mock_session.items = None  # Must not be touched when an index is given
+        for argname in ("first_fixture", "second_fixture"):
+            mock_fixturedef = Mock()
+            mock_fixturedef.argname = argname
+            _mark_dependent_tests_for_skip(
+                mock_session, mock_fixturedef, ValueError("boom"), fixture_to_items
+            )
+
+        mock_item1.add_marker.assert_called_once()
+        mock_item2.add_marker.assert_called_once()
+
+    def test_index_items_by_fixture_ignores_repeated_names(self):
+        """An item listing a fixture twice is indexed, and so skipped, once."""
+        from pytest_fixturecheck.plugin import _index_items_by_fixture
+
+        mock_item = Mock()
+        mock_item.fixturenames = ("failing_fixture", "request", "failing_fixture")
+
+        fixture_to_items = _index_items_by_fixture([mock_item])
+        assert fixture_to_items["failing_fixture"] == [mock_item]
+
+        mock_fixturedef = Mock()
+        mock_fixturedef.argname = "failing_fixture"
+        _mark_dependent_tests_for_skip(
+            Mock(), mock_fixturedef, ValueError("boom"), fixture_to_items
+        )
+        mock_item.add_marker.assert_called_once()
+
+    def test_index_items_by_fixture_limited_to_requested_names(self):
+        """Only the requested fixture names are indexed."""
+        from pytest_fixturecheck.plugin import _index_items_by_fixture
+
+        mock_item1 = Mock()
+        mock_item1.fixturenames = ["failing_fixture", "request", "tmp_path"]
+        mock_item2 = Mock()
+        mock_item2.fixturenames = ["tmp_path"]
+
+        fixture_to_items = _index_items_by_fixture([mock_item1, mock_item2], {"failing_fixture"})
+        assert fixture_to_items == {"failing_fixture": [mock_item1]}
+
+    def test_report_fixture_errors_locates_wrapped_fixture(self, capsys):
+        """The reported location is the user's fixture, not the fixturecheck wrapper."""
+        import inspect
+
+        from pytest_fixturecheck import fixturecheck
+
+        def user_fixture():
+            return None
+
+        mock_fixturedef = Mock()
+        mock_fixturedef.argname = "user_fixture"
+        mock_fixturedef.func = fixturecheck()(user_fixture)
+
+        report_fixture_errors([(mock_fixturedef, ValueError("bad"), "")])
+
+        expected = f"{__file__}:{inspect.getsourcelines(user_fixture)[1]}"
+        assert f"in {expected} failed validation" in capsys.readouterr().out
+
+    def test_report_fixture_errors_locates_each_fixture_once(self, capsys):
+        """A fixture failing in both phases is only located once."""
+        mock_fixturedef = Mock()
+        mock_fixturedef.argname = "twice"
+        mock_fixturedef.func = lambda: None
+        failed_fixtures = [
+            (mock_fixturedef, AssertionError("collection"), ""),
+            (mock_fixturedef, ValueError("execution"), ""),
+        ]
+
+        with patch(
+            "pytest_fixturecheck.plugin._fixture_location", return_value="here.py:1"
+        ) as mock_location:
+            report_fixture_errors(failed_fixtures)
+
+        mock_location.assert_called_once_with(mock_fixturedef.func)
+        assert capsys.readouterr().out.count("in here.py:1 failed validation") == 2
+
     def test_report_fixture_errors_with_import_error(self, capsys):
         """Test report_fixture_errors with import error."""
         mock_fixturedef = Mock()
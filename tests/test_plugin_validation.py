@@ -1,5 +1,6 @@
 """Tests for core plugin validation functionality."""
 
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,12 +20,19 @@ def test_pytest_addoption():
     """Test that pytest_addoption adds the right configuration options."""
     parser = MagicMock()
     pytest_addoption(parser)
-    parser.addini.assert_called_once_with(
+    assert parser.addini.call_count == 2
+    parser.addini.assert_any_call(
         "fixturecheck-auto-skip",
         help="Automatically skip tests with invalid fixtures instead of failing",
         default="false",
         type="bool",
     )
+    parser.addini.assert_any_call(
+        "fixturecheck-parallel",
+        help="Run @fixturecheck validators on fixture results concurrently in a thread pool",
+        default="false",
+        type="bool",
+    )
 
 
 def test_pytest_configure():
@@ -95,7 +103,7 @@ def test_pytest_fixture_setup():
     assert request.config._fixturecheck_fixtures
 
 
-def test_report_fixture_errors():
+def test_report_fixture_errors(capsys):
     """Test fixture error reporting."""
     # Create a mock fixturedef with an error
     fixturedef = MagicMock()
@@ -108,16 +116,15 @@ def test_report_fixture_errors():
     error = ValueError("Fixture validation failed")
     tb = 'Traceback (most recent call last):\n  File "test.py", line 10, in test\n    raise ValueError("Fixture validation failed")'
 
-    # Capture the output
-    with patch("builtins.print") as mock_print:
+    # The whole report is written to stdout in a single call
+    with patch("sys.stdout.write", wraps=sys.stdout.write) as mock_write:
         report_fixture_errors([(fixturedef, error, tb)])
+        mock_write.assert_called_once()
 
-        # Verify the error was reported
-        assert any("Fixture 'broken_fixture'" in call[0][0] for call in mock_print.call_args_list)
-        assert any(
-            "ValueError: Fixture validation failed" in call[0][0]
-            for call in mock_print.call_args_list
-        )
+    # Verify the error was reported
+    output = capsys.readouterr().out
+    assert "Fixture 'broken_fixture'" in output
+    assert "ValueError: Fixture validation failed" in output
 
 
 def test_mark_dependent_tests_for_skip():
@@ -11,7 +11,7 @@ from pytest_fixturecheck import fixturecheck
 @pytest.fixture
 async def simple_async_fixture():
     """A simple async fixture."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return "async value"
 
 
@@ -10,6 +10,7 @@ import warnings
 
 import pytest
 
+from pytest_fixturecheck import FixtureCheckWarning
 from pytest_fixturecheck.validators_fix import (
     check_property_values,
     with_property_values,
@@ -72,6 +73,16 @@ def test_strict_parameter_false_in_check_property_values():
         assert "Expected value=42" in str(recorded_warnings[1].message)
 
 
+def test_strict_false_warning_category():
+    """Non-strict validators warn with FixtureCheckWarning, a UserWarning subclass."""
+    validator = check_property_values(strict=False, name="test")
+
+    with pytest.warns(FixtureCheckWarning, match="Expected name=test"):
+        validator(StrictParamTestObject("wrong", 99), False)
+
+    assert issubclass(FixtureCheckWarning, UserWarning)
+
+
 def test_strict_parameter_default_in_with_property_values():
     """Test that strict=True (default) raises exceptions in with_property_values."""
 
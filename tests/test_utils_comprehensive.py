@@ -88,6 +88,82 @@ class TestCreatesValidator:
 
         # This demonstrates the behavior of creates_validator when it wraps validator functions
 
+    def test_creates_validator_reuses_factory(self):
+        """Decorating the same function twice returns the same factory."""
+        import functools
+
+        def check(obj, expected_value):
+            pass
+
+        factory = creates_validator(check)
+        assert creates_validator(check) is factory
+
+        # A wrapper that copied check's attributes still gets its own factory
+        @functools.wraps(check)
+        def wrapped_check(obj, expected_value):
+            return check(obj, expected_value)
+
+        assert creates_validator(wrapped_check) is not factory
+
+    def test_signatures_inspected_outside_validation(self, monkeypatch):
+        """Signatures are read when validators are built, not when they run."""
+        calls = []
+
+        @creates_validator
+        def has_value(expected_value):
+            def validate(obj, is_collection_phase=False):
+                calls.append((obj, is_collection_phase))
+
+            return validate
+
+        validator = has_value(1)
+
+        def fail_signature(obj):
+            raise AssertionError("inspect.signature called during validation")
+
+        monkeypatch.setattr(inspect, "signature", fail_signature)
+        validator("value", False)
+        validator("value", True)
+        assert calls == [("value", False)]
+
+    def test_wrapper_matches_inner_validator_signature(self):
+        """The wrapper passes is_collection_phase only to validators that accept it."""
+        calls = []
+
+        @creates_validator
+        def plain(expected_value):
+            def check_plain(obj):
+                calls.append(("plain", obj))
+
+            return check_plain
+
+        @creates_validator
+        def phase_aware(expected_value):
+            def check_phase_aware(obj, is_collection_phase=False):
+                calls.append(("phase_aware", obj, is_collection_phase))
+
+            return check_phase_aware
+
+        plain_validator = plain(1)
+        phase_validator = phase_aware(1)
+        plain_validator("value", False)
+        phase_validator("value", False)
+
+        assert calls == [("plain", "value"), ("phase_aware", "value", False)]
+        assert plain_validator.__name__ == "check_plain"
+        assert phase_validator.__name__ == "check_phase_aware"
+
+    def test_noop_validator_is_marked(self):
+        """The no-op validator returned for a missing argument is marked as a validator."""
+
+        @creates_validator
+        def needs_args(obj, expected_value):
+            pass
+
+        validator = needs_args()
+        assert validator._is_pytest_fixturecheck_validator is True
+        assert validator("value", False) is None
+
 
 class TestAsyncUtils:
     """Tests for the async utility functions."""
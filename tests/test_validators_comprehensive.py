@@ -1,5 +1,6 @@
 """Comprehensive tests for validator functions."""
 
+import sys
 from collections import namedtuple
 
 import pytest
@@ -119,6 +120,19 @@ class TestIsInstanceOf:
             is_instance_of((CompTestObject, dict))(obj)
         assert "Expected instance of one of (CompTestObject, dict), got int" in str(excinfo.value)
 
+    def test_marked_before_first_call(self):
+        """The validator marker is set when the validator is built."""
+        assert is_instance_of(CompTestObject)._is_pytest_fixturecheck_validator is True
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y unions need Python 3.10+")
+    def test_union_type_without_name(self):
+        """A ``X | Y`` union can be checked even though it has no __name__."""
+        validator = is_instance_of(CompTestObject | dict)
+        validator({})
+
+        with pytest.raises(TypeError, match="got int"):
+            validator(42)
+
 
 # Test for has_required_fields validator
 class TestHasRequiredFields:
@@ -165,6 +179,20 @@ class TestHasRequiredFields:
         # Should not raise exception
         validator(person, False)
 
+    def test_each_field_read_once(self):
+        """Each field is fetched with a single attribute lookup."""
+        reads = []
+
+        class Counted:
+            @property
+            def name(self):
+                reads.append("name")
+                return "test"
+
+        has_required_fields("name")(Counted(), False)
+        has_property_values(name="test")(Counted(), False)
+        assert reads == ["name", "name"]
+
     def test_function_skipping(self):
         """Test that functions are skipped."""
         validator = has_required_fields("nonexistent")
@@ -207,6 +235,10 @@ class TestHasRequiredMethods:
             validator_instance(obj)
         assert "'name' is not callable" in str(excinfo.value)
 
+    def test_marked_before_first_call(self):
+        """The validator marker is set when the validator is built."""
+        assert has_required_methods("method1")._is_pytest_fixturecheck_validator is True
+
 
 # Test for has_property_values validator
 class TestHasPropertyValues:
@@ -237,6 +269,11 @@ class TestHasPropertyValues:
             validator_instance(obj)
         assert "Expected value=99, got 42" in str(excinfo.value)
 
+    def test_marked_before_first_call(self):
+        """The validator marker is set when the validator is built."""
+        validator_instance = has_property_values(name="test")
+        assert validator_instance._is_pytest_fixturecheck_validator is True
+
 
 # Test for combines_validators
 class TestCombinesValidators:
@@ -256,6 +293,57 @@ class TestCombinesValidators:
         # Should not raise exception
         validator(obj, is_collection_phase=False)
 
+    def test_combined_validator_is_marked_before_first_call(self):
+        """The combined validator carries the validator marker as soon as it is built."""
+        validator = combines_validators(is_instance_of(CompTestObject))
+        assert validator._is_pytest_fixturecheck_validator is True
+
+    def test_single_marked_validator_is_not_rewrapped(self):
+        """Combining one marked validator returns that validator unchanged."""
+        inner = combines_validators(is_instance_of(CompTestObject), has_required_fields("name"))
+        assert combines_validators(inner) is inner
+
+        def unmarked(obj, is_collection_phase=False):
+            pass
+
+        assert combines_validators(unmarked) is not unmarked
+
+    def test_collection_phase_passed_to_children(self):
+        """Every child is called with the phase the combined validator received."""
+        calls = []
+
+        def recording_validator(obj, is_collection_phase=False):
+            calls.append(is_collection_phase)
+
+        combined = combines_validators(recording_validator, recording_validator)
+
+        combined(CompTestObject(), is_collection_phase=True)
+        assert calls == [True, True]
+
+        combined(CompTestObject())
+        assert calls == [True, True, False, False]
+
+    @pytest.mark.parametrize("is_collection_phase", [True, False])
+    def test_single_and_multiple_combinations_agree(self, is_collection_phase):
+        """Combining one validator or several copies of it gives the same phase result."""
+
+        def fixture_func():
+            pass
+
+        def outcome(validator):
+            try:
+                validator(fixture_func, is_collection_phase)
+            except TypeError as e:
+                return str(e)
+            return None
+
+        single = combines_validators(is_instance_of(CompTestObject))
+        multiple = combines_validators(
+            is_instance_of(CompTestObject), is_instance_of(CompTestObject)
+        )
+        assert outcome(single) == outcome(multiple)
+        assert outcome(single) == "Expected instance of CompTestObject, got function"
+
     def test_combined_validators_failure(self):
         """Test combining validators where one should fail."""
         obj = CompTestObject(name="test", value=123)